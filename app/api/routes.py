@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Response
 
 from app.controllers import recommendation_controller
 
@@ -12,7 +14,7 @@ def health_check():
 
 
 @router.get("/recommendations", tags=["recommendations"])
-def get_recommendations(
+async def get_recommendations(
     lat: float,
     lng: float,
     category: str | None = None,
@@ -21,11 +23,18 @@ def get_recommendations(
     """
     Get recommendations for any location within Addis Ababa.
     """
-    return recommendation_controller.get_recommendations(
+    # Ranking is CPU-bound; run it on a worker thread so the event loop
+    # stays free. The numba kernel drops the GIL (nogil=True), letting
+    # concurrent requests actually overlap on large batches.
+    payload = await asyncio.to_thread(
+        recommendation_controller.get_recommendations,
         lat=lat,
         lng=lng,
         category=category,
         limit=limit,
     )
+    # The controller returns pre-encoded JSON bytes; hand them straight to
+    # the client without another serialization pass.
+    return Response(content=payload, media_type="application/json")
 
 
@@ -1,15 +1,36 @@
-from app.schemas.recommendation import RecommendationResponse
+from functools import lru_cache
+
 from app.services.recommendation_service import RecommendationService
 
 service = RecommendationService()
 
 
+@lru_cache(maxsize=4096)
+def _cached_recommendations(
+    lat_q: int,
+    lng_q: int,
+    category: str | None,
+    limit: int,
+) -> bytes:
+    return service.get_recommendations_json(
+        lat=lat_q / 1e4, lng=lng_q / 1e4, category=category, limit=limit
+    )
+
+
 def get_recommendations(
     lat: float,
     lng: float,
     category: str | None,
     limit: int,
-) -> list[RecommendationResponse]:
-    return service.get_recommendations(lat=lat, lng=lng, category=category, limit=limit)
+) -> bytes:
+    # GPS clients send many near-duplicate coordinates; quantizing to 4
+    # decimals (~10 m) makes those hit the same cache entry. Caching the
+    # encoded bytes means repeat hits skip serialization entirely.
+    return _cached_recommendations(
+        int(lat * 1e4),
+        int(lng * 1e4),
+        category.lower() if category else None,
+        limit,
+    )
 
 
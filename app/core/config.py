@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class CityBoundary(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CityBoundary:
     name: str
     min_lat: float
     max_lat: float
@@ -9,7 +10,8 @@ class CityBoundary(BaseModel):
     max_lng: float
 
 
-class Settings(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Settings:
     city_name: str = "Addis Ababa"
     # Simple bounding box for Addis Ababa (approximate; can be refined)
     boundary: CityBoundary = CityBoundary(
@@ -22,5 +24,3 @@ class Settings(BaseModel):
 
 
 settings = Settings()
-
-
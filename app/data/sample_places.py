@@ -1,7 +1,7 @@
 from app.models.location import Location, Place
 
 # NOTE: These are illustrative coordinates in Addis Ababa; replace/extend with real data.
-SAMPLE_PLACES: list[Place] = [
+SAMPLE_PLACES: tuple[Place, ...] = (
     Place(
         id="1",
         name="Piassa Cafe",
@@ -26,6 +26,6 @@ SAMPLE_PLACES: list[Place] = [
         district="Kirkos",
         sub_city="Meskel",
     ),
-]
+)
 
 
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router as api_router
 
@@ -8,6 +9,8 @@ def create_app() -> FastAPI:
         title="Addis Ababa Recommendation System",
         description="API for city-wide recommendations in Addis Ababa.",
         version="0.1.0",
+        # orjson serializes responses much faster than the default json codec.
+        default_response_class=ORJSONResponse,
     )
 
     # Register API routes
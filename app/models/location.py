@@ -1,17 +1,29 @@
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     """
     Represents a geographic point in Addis Ababa.
+
+    The radian/cosine forms of the coordinates are derived once at
+    construction so distance code never repeats those conversions per call.
     """
 
     lat: float
     lng: float
+    lat_rad: float = field(init=False, repr=False, compare=False)
+    lng_rad: float = field(init=False, repr=False, compare=False)
+    cos_lat: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "lat_rad", math.radians(self.lat))
+        object.__setattr__(self, "lng_rad", math.radians(self.lng))
+        object.__setattr__(self, "cos_lat", math.cos(math.radians(self.lat)))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Place:
     """
     Represents a place that can be recommended.
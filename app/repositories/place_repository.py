@@ -1,26 +1,282 @@
-from abc import ABC, abstractmethod
-from typing import Iterable
+import math
+from typing import Iterable, Protocol
 
+import numpy as np
+import orjson
+
+from app.core.config import settings
 from app.models.location import Place
 from app.data.sample_places import SAMPLE_PLACES
+from app.utils import geo_numba
+
+EARTH_RADIUS_METERS = 6371000.0
+
+# Cells per axis of the uniform grid laid over the city bounding box.
+GRID_SIZE = 64
+
+# Below this many candidates, NumPy beats the jitted kernel's call overhead.
+NUMBA_MIN_CANDIDATES = 256
 
 
-class AbstractPlaceRepository(ABC):
-    @abstractmethod
-    def list_places(self) -> Iterable[Place]:
-        raise NotImplementedError
+class PlaceRepository(Protocol):
+    """Structural interface for repositories; static-typing only, so
+    implementations pay no ABC registration or dispatch cost."""
 
+    def list_places(self, category: str | None = None) -> Iterable[Place]: ...
 
-class InMemoryPlaceRepository(AbstractPlaceRepository):
+
+class InMemoryPlaceRepository:
     """
     Simple in-memory repository backed by static Addis Ababa data.
     Replace with a DB-backed implementation when needed.
+
+    Coordinates are cached as Struct-of-Arrays NumPy columns so distance
+    ranking runs as one vectorized pass instead of a per-Place Python loop.
     """
 
     def __init__(self) -> None:
-        self._places: list[Place] = SAMPLE_PLACES
+        self._places: tuple[Place, ...] = SAMPLE_PLACES
+
+        # Struct-of-Arrays coordinate cache, filled from the values each
+        # Location already derived at construction. The ranking columns are
+        # float32: half the memory traffic and twice the SIMD lanes, while
+        # city-scale distances stay accurate to well under a meter.
+        self._lat = np.array([p.location.lat for p in self._places], dtype=np.float64)
+        self._lng = np.array([p.location.lng for p in self._places], dtype=np.float64)
+        self._lat_rad = np.array(
+            [p.location.lat_rad for p in self._places], dtype=np.float32
+        )
+        self._lng_rad = np.array(
+            [p.location.lng_rad for p in self._places], dtype=np.float32
+        )
+        self._cos_lat = np.array(
+            [p.location.cos_lat for p in self._places], dtype=np.float32
+        )
+
+        # Category -> indices into the SoA arrays, resolved once at load
+        # time so per-request filtering never re-lowercases place data.
+        cat_lists: dict[str, list[int]] = {}
+        for i, place in enumerate(self._places):
+            cat_lists.setdefault(place.category.lower(), []).append(i)
+        self._cat_index: dict[str, np.ndarray] = {
+            category: np.asarray(indices, dtype=np.int32)
+            for category, indices in cat_lists.items()
+        }
+        # Boolean membership masks derived from the same index, for O(1)
+        # per-candidate checks during grid ring scans.
+        self._cat_mask: dict[str, np.ndarray] = {}
+        for category, indices in self._cat_index.items():
+            mask = np.zeros(len(self._places), dtype=bool)
+            mask[indices] = True
+            self._cat_mask[category] = mask
+
+        # Uniform grid over the city bounding box. The data lives in a
+        # small fixed bbox, so a flat grid gives O(1) cell lookup with no
+        # tree traversal; each cell holds indices into the arrays above.
+        boundary = settings.boundary
+        self._min_lat = boundary.min_lat
+        self._min_lng = boundary.min_lng
+        self._lat_span = boundary.max_lat - boundary.min_lat
+        self._lng_span = boundary.max_lng - boundary.min_lng
+        self._grid: list[list[list[int]]] = [
+            [[] for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)
+        ]
+        for i in range(len(self._places)):
+            ix, iy = self._cell_of(self._lat[i], self._lng[i])
+            self._grid[iy][ix].append(i)
+
+        # Per-category place tuples, cached once so category filtering is a
+        # dict lookup instead of an O(N) scan per request.
+        by_category: dict[str, list[Place]] = {}
+        for place in self._places:
+            by_category.setdefault(place.category.lower(), []).append(place)
+        self._by_category: dict[str, tuple[Place, ...]] = {
+            category: tuple(places) for category, places in by_category.items()
+        }
+
+        # Static response fields serialized once at load time. Each entry
+        # is a JSON object missing its closing brace, so a request only
+        # appends the distance and "}" instead of re-encoding the place.
+        self._prebody: list[bytes] = [
+            orjson.dumps(
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "category": p.category,
+                    "location": {"lat": p.location.lat, "lng": p.location.lng},
+                    "district": p.district,
+                    "sub_city": p.sub_city,
+                }
+            )[:-1]
+            for p in self._places
+        ]
+
+        if geo_numba.HAS_NUMBA:
+            # Pay the JIT compilation cost here, not on the first request.
+            geo_numba.warmup()
+
+    def _cell_of(self, lat: float, lng: float) -> tuple[int, int]:
+        """Map a coordinate to its (ix, iy) grid cell, clamped to the grid."""
+        ix = int((lng - self._min_lng) / self._lng_span * GRID_SIZE)
+        iy = int((lat - self._min_lat) / self._lat_span * GRID_SIZE)
+        return (
+            min(max(ix, 0), GRID_SIZE - 1),
+            min(max(iy, 0), GRID_SIZE - 1),
+        )
+
+    def query_knn(
+        self, lat: float, lng: float, k: int, category: str | None
+    ) -> np.ndarray:
+        """
+        Return indices (into the place arrays) of candidates for the k
+        nearest places, collected from the uniform grid.
+
+        Expands outward from the query cell one ring at a time until at
+        least `k` matching candidates are found. Cells are square-ish but
+        rings bound Chebyshev distance, so a nearer point can still sit up
+        to ~sqrt(2) times further out in ring count; keep scanning past the
+        fill ring by that margin. The caller still distance-ranks the
+        candidates exactly.
+        """
+        mask = None
+        if category is not None:
+            indices = self.indices_for_category(category)
+            if indices.size <= k:
+                # The whole category fits in the result; no grid walk needed.
+                return indices
+            mask = self._cat_mask[category.lower()]
+
+        cx, cy = self._cell_of(lat, lng)
+
+        candidates: list[int] = []
+        filled_ring: int | None = None
+        for ring in range(GRID_SIZE):
+            if filled_ring is not None and ring > math.ceil((filled_ring + 1) * 1.5):
+                break
+            for i in self._iter_ring_cells(cx, cy, ring):
+                if mask is None or mask[i]:
+                    candidates.append(i)
+            if filled_ring is None and len(candidates) >= k:
+                filled_ring = ring
+
+        return np.array(candidates, dtype=np.intp)
+
+    def indices_for_category(self, category: str | None) -> np.ndarray:
+        """Indices into the SoA arrays for a category (all places if None)."""
+        if category is None:
+            return np.arange(len(self._places), dtype=np.int32)
+        return self._cat_index.get(category.lower(), np.empty(0, dtype=np.int32))
+
+    def _iter_ring_cells(self, cx: int, cy: int, ring: int) -> Iterable[int]:
+        """Yield place indices from cells at Chebyshev distance `ring`."""
+        if ring == 0:
+            yield from self._grid[cy][cx]
+            return
+
+        x_lo, x_hi = max(cx - ring, 0), min(cx + ring, GRID_SIZE - 1)
+        # Top and bottom rows of the ring.
+        for iy in (cy - ring, cy + ring):
+            if 0 <= iy < GRID_SIZE:
+                for ix in range(x_lo, x_hi + 1):
+                    yield from self._grid[iy][ix]
+        # Left and right columns, excluding the corners already visited.
+        for ix in (cx - ring, cx + ring):
+            if 0 <= ix < GRID_SIZE:
+                for iy in range(max(cy - ring + 1, 0), min(cy + ring - 1, GRID_SIZE - 1) + 1):
+                    yield from self._grid[iy][ix]
+
+    def list_places(self, category: str | None = None) -> tuple[Place, ...]:
+        # The stored tuple is immutable, so it is returned without copying.
+        if category is None:
+            return self._places
+        return self._by_category.get(category.lower(), ())
+
+    def _rank_indices(
+        self,
+        lat: float,
+        lng: float,
+        category: str | None,
+        limit: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return (place indices, distances in meters) for the `limit` places
+        nearest to (lat, lng), closest first.
+
+        Distances are computed with a vectorized equirectangular
+        approximation over the cached coordinate arrays (sub-0.1% error at
+        city scale); top-k selection uses `np.argpartition` (O(N)) instead
+        of a full sort.
+        """
+        candidates = self.query_knn(lat, lng, limit, category)
+        if candidates.size == 0:
+            return candidates, np.empty(0, dtype=np.float64)
+        lat_rad = self._lat_rad[candidates]
+        lng_rad = self._lng_rad[candidates]
+
+        # float32 scalars keep the whole batch in FP32 under NumPy's weak
+        # promotion rules; results are upcast per survivor at the end.
+        origin_lat_rad = np.float32(math.radians(lat))
+        origin_lng_rad = np.float32(math.radians(lng))
+
+        if geo_numba.HAS_NUMBA and candidates.size >= NUMBA_MIN_CANDIDATES:
+            # Fused single-pass kernel: inline haversine feeding a bounded
+            # max-heap, so only k distances are ever kept.
+            k = min(limit, candidates.size)
+            heap_d = np.empty(k, dtype=np.float64)
+            heap_idx = np.empty(k, dtype=np.int64)
+            size = geo_numba.rank_knn(
+                origin_lat_rad, origin_lng_rad, lat_rad, lng_rad, k, heap_d, heap_idx
+            )
+            order = np.argsort(heap_d[:size])
+            return candidates[heap_idx[order]], heap_d[order]
+        else:
+            # Equirectangular projection: the boundary check upstream keeps
+            # us in the small-angle regime, so one cos of the origin
+            # latitude is enough for the whole batch. Rank on the squared
+            # form - ordering is identical, and the sqrt then only runs on
+            # the k survivors below.
+            dlat = lat_rad - origin_lat_rad
+            dlng = (lng_rad - origin_lng_rad) * math.cos(origin_lat_rad)
+            distances = dlat * dlat + dlng * dlng
+
+        k = min(limit, distances.size)
+        if k < distances.size:
+            top = np.argpartition(distances, k)[:k]
+        else:
+            top = np.arange(distances.size)
+        top = top[np.argsort(distances[top])]
+
+        meters = EARTH_RADIUS_METERS * np.sqrt(distances[top])
+        return candidates[top], meters
 
-    def list_places(self) -> Iterable[Place]:
-        return list(self._places)
+    def rank(
+        self,
+        lat: float,
+        lng: float,
+        category: str | None,
+        limit: int,
+    ) -> list[tuple[Place, float]]:
+        """
+        Return the `limit` places nearest to (lat, lng), closest first.
+        """
+        indices, meters = self._rank_indices(lat, lng, category, limit)
+        return [(self._places[i], float(d)) for i, d in zip(indices, meters)]
 
+    def rank_serialized(
+        self,
+        lat: float,
+        lng: float,
+        category: str | None,
+        limit: int,
+    ) -> bytes:
+        """
+        Return the `limit` nearest places as a JSON array, pre-encoded.
 
+        Each place's static fields were serialized once at load time; per
+        request only the distance value is formatted and spliced in.
+        """
+        indices, meters = self._rank_indices(lat, lng, category, limit)
+        return b"[" + b",".join(
+            self._prebody[i] + b',"distance_meters":%a}' % float(d)
+            for i, d in zip(indices, meters)
+        ) + b"]"
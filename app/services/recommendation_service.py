@@ -1,9 +1,8 @@
-from typing import Iterable
+from typing import Any
 
-from app.models.location import Location, Place
+from app.models.location import Location
 from app.repositories.place_repository import InMemoryPlaceRepository
-from app.schemas.recommendation import LocationPoint, RecommendationResponse
-from app.utils.geo import haversine_distance_meters, is_within_addis
+from app.utils.geo import is_within_addis
 
 
 class RecommendationService:
@@ -13,6 +12,10 @@ class RecommendationService:
 
     def __init__(self) -> None:
         self._places_repo = InMemoryPlaceRepository()
+        # Bind the hot repository method once; per-request calls skip the
+        # attribute lookup and descriptor binding.
+        self._rank = self._places_repo.rank
+        self._rank_serialized = self._places_repo.rank_serialized
 
     def get_recommendations(
         self,
@@ -20,7 +23,7 @@ class RecommendationService:
         lng: float,
         category: str | None,
         limit: int,
-    ) -> list[RecommendationResponse]:
+    ) -> list[dict[str, Any]]:
         user_location = Location(lat=lat, lng=lng)
 
         if not is_within_addis(user_location):
@@ -28,40 +31,44 @@ class RecommendationService:
             # Here we simply return an empty list to indicate out-of-bound requests.
             return []
 
-        places = self._places_repo.list_places()
-        filtered = self._filter_places(places, category)
-        ranked = self._rank_by_distance(filtered, user_location)
+        # Vectorized filter + rank + top-k in one pass over the repository's
+        # coordinate arrays.
+        ranked = self._rank(lat, lng, category, limit)
 
+        # Plain dicts: ORJSONResponse serializes them directly, skipping
+        # per-field Pydantic validation on every request.
         return [
-            RecommendationResponse(
-                id=place.id,
-                name=place.name,
-                category=place.category,
-                location=LocationPoint(lat=place.location.lat, lng=place.location.lng),
-                district=place.district,
-                sub_city=place.sub_city,
-                distance_meters=distance,
-            )
-            for place, distance in ranked[:limit]
+            {
+                "id": place.id,
+                "name": place.name,
+                "category": place.category,
+                "location": {"lat": place.location.lat, "lng": place.location.lng},
+                "district": place.district,
+                "sub_city": place.sub_city,
+                "distance_meters": distance,
+            }
+            for place, distance in ranked
         ]
 
-    def _filter_places(
-        self, places: Iterable[Place], category: str | None
-    ) -> list[Place]:
-        if category is None:
-            return list(places)
-        category_lower = category.lower()
-        return [p for p in places if p.category.lower() == category_lower]
+    def get_recommendations_json(
+        self,
+        lat: float,
+        lng: float,
+        category: str | None,
+        limit: int,
+    ) -> bytes:
+        """
+        Same results as `get_recommendations`, returned as encoded JSON.
+
+        The repository splices pre-serialized static fields together with
+        the per-request distances, so no dicts are built and no encoder
+        runs on the hot path.
+        """
+        user_location = Location(lat=lat, lng=lng)
 
-    def _rank_by_distance(
-        self, places: Iterable[Place], origin: Location
-    ) -> list[tuple[Place, float]]:
-        ranked: list[tuple[Place, float]] = []
-        for place in places:
-            distance = haversine_distance_meters(origin, place.location)
-            ranked.append((place, distance))
+        if not is_within_addis(user_location):
+            return b"[]"
 
-        ranked.sort(key=lambda item: item[1])
-        return ranked
+        return self._rank_serialized(lat, lng, category, limit)
 
 
@@ -9,25 +9,29 @@ def haversine_distance_meters(a: Location, b: Location) -> float:
     Compute great-circle distance between two points (meters).
     """
     r = 6371000  # Earth radius in meters
-    lat1, lon1, lat2, lon2 = map(math.radians, [a.lat, a.lng, b.lat, b.lng])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
+    dlat = b.lat_rad - a.lat_rad
+    dlon = b.lng_rad - a.lng_rad
 
     h = (
         math.sin(dlat / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        + a.cos_lat * b.cos_lat * math.sin(dlon / 2) ** 2
     )
     return 2 * r * math.asin(math.sqrt(h))
 
 
+# Boundary constants hoisted out of the Pydantic settings model once at
+# import; is_within_addis runs before any work on every request, so it
+# should not pay attribute-descriptor overhead per call.
+_BOUNDARY = settings.boundary
+_MIN_LAT, _MAX_LAT = _BOUNDARY.min_lat, _BOUNDARY.max_lat
+_MIN_LNG, _MAX_LNG = _BOUNDARY.min_lng, _BOUNDARY.max_lng
+
+
 def is_within_addis(location: Location) -> bool:
     """
     Check if a location lies within the configured Addis Ababa boundary.
     """
-    boundary = settings.boundary
-    return (
-        boundary.min_lat <= location.lat <= boundary.max_lat
-        and boundary.min_lng <= location.lng <= boundary.max_lng
-    )
+    lat, lng = location.lat, location.lng
+    return (_MIN_LAT <= lat <= _MAX_LAT) & (_MIN_LNG <= lng <= _MAX_LNG)
 
 
@@ -0,0 +1,116 @@
+"""
+Optional Numba-fused haversine kernel.
+
+NumPy vectorization still materializes every intermediate array (dlat,
+sin(dlat/2), ...); fusing the whole computation into one jitted loop
+removes those temporaries and lets LLVM auto-vectorize with fastmath
+sin/cos. Numba is optional: callers must check HAS_NUMBA and fall back to
+the NumPy path when it is unavailable.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    HAS_NUMBA = False
+
+EARTH_RADIUS_METERS = 6371000.0
+
+
+if HAS_NUMBA:
+
+    @njit(nogil=True, fastmath=True, cache=True)
+    def rank_knn(
+        lat0: float,
+        lng0: float,
+        lat_arr: np.ndarray,
+        lng_arr: np.ndarray,
+        k: int,
+        out_d: np.ndarray,
+        out_idx: np.ndarray,
+    ) -> int:
+        """
+        Single-pass fused haversine + top-k selection.
+
+        Streams over the coordinate arrays once, keeping the k nearest
+        points in a bounded max-heap (out_d / out_idx, length >= k), so no
+        full distance array is ever materialized. Returns the number of
+        results written; heapify order, not sorted - callers sort the
+        returned prefix.
+        """
+        n = lat_arr.shape[0]
+        cos_lat0 = math.cos(lat0)
+        size = 0
+        for i in range(n):
+            dlat = lat_arr[i] - lat0
+            dlng = lng_arr[i] - lng0
+            a = (
+                math.sin(dlat * 0.5) ** 2
+                + cos_lat0 * math.cos(lat_arr[i]) * math.sin(dlng * 0.5) ** 2
+            )
+            d = 2.0 * EARTH_RADIUS_METERS * math.asin(math.sqrt(a))
+
+            if size < k:
+                # Sift up into the max-heap.
+                out_d[size] = d
+                out_idx[size] = i
+                child = size
+                size += 1
+                while child > 0:
+                    parent = (child - 1) // 2
+                    if out_d[parent] < out_d[child]:
+                        out_d[parent], out_d[child] = out_d[child], out_d[parent]
+                        out_idx[parent], out_idx[child] = (
+                            out_idx[child],
+                            out_idx[parent],
+                        )
+                        child = parent
+                    else:
+                        break
+            elif d < out_d[0]:
+                # Replace the current worst and sift down.
+                out_d[0] = d
+                out_idx[0] = i
+                parent = 0
+                while True:
+                    left = 2 * parent + 1
+                    right = left + 1
+                    largest = parent
+                    if left < size and out_d[left] > out_d[largest]:
+                        largest = left
+                    if right < size and out_d[right] > out_d[largest]:
+                        largest = right
+                    if largest == parent:
+                        break
+                    out_d[parent], out_d[largest] = out_d[largest], out_d[parent]
+                    out_idx[parent], out_idx[largest] = (
+                        out_idx[largest],
+                        out_idx[parent],
+                    )
+                    parent = largest
+        return size
+
+    def warmup() -> None:
+        """Trigger JIT compilation once at startup instead of mid-request.
+
+        The origin scalars must be np.float32 to match what _rank_indices
+        passes; Python floats would compile a float64 overload that
+        production never calls, leaving the real signature to JIT on the
+        first request.
+        """
+        arr = np.zeros(1, dtype=np.float32)
+        origin = np.float32(0.0)
+        rank_knn(
+            origin,
+            origin,
+            arr,
+            arr,
+            1,
+            np.empty(1, dtype=np.float64),
+            np.empty(1, dtype=np.int64),
+        )
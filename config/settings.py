@@ -9,6 +9,13 @@ from typing import Dict, Tuple
 # Cache Configuration
 CACHE_DIR = Path("cache/osmnx")
 GRAPH_CACHE_FILE = CACHE_DIR / "addis_ababa.graphml"
+# Flat-array adjacency cache: one .npy per CSR array, memory-mapped on
+# reload so warm starts fault pages in on demand instead of re-walking
+# the graphml.
+CSR_CACHE_DIR = CACHE_DIR / "addis_ababa_csr"
+# Basemap tiles survive across runs here so warm starts never touch
+# the tile servers; contextily keys entries by (zoom, x, y) itself.
+TILE_CACHE_DIR = Path.home() / ".cache" / "aa_tiles"
 
 # Map Configuration
 DEFAULT_CITY = "Addis Ababa, Ethiopia"
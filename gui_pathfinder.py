@@ -8,18 +8,48 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import sys
 from pathlib import Path
+import functools
+import hashlib
+import itertools
 import threading
 import tempfile
 import webbrowser
 from typing import List
+import numpy as np
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import networkx as nx
-import osmnx as ox
-import contextily as ctx
-import folium
+from matplotlib.collections import LineCollection
+
+# Let Agg decimate sub-pixel path vertices before rasterizing and
+# stroke long paths in chunks; at city zoom most road edges collapse
+# below a pixel, so this trims the vertex stream for every draw.
+mpl.rcParams['path.simplify'] = True
+mpl.rcParams['path.simplify_threshold'] = 1.0
+mpl.rcParams['agg.path.chunksize'] = 10000
+from bisect import bisect_left
 from difflib import get_close_matches
 
+try:
+    # rapidfuzz runs its scorers in C; difflib's SequenceMatcher is the
+    # dominant per-keystroke cost on large name lists, so prefer it.
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+
+def fuzzy_matches(query, choices, n, cutoff):
+    """Best fuzzy matches for query among choices, rapidfuzz if available."""
+    if HAS_RAPIDFUZZ:
+        return [
+            match
+            for match, score, _ in rf_process.extract(
+                query, choices, scorer=rf_fuzz.WRatio, limit=n, score_cutoff=cutoff * 100
+            )
+        ]
+    return get_close_matches(query, choices, n=n, cutoff=cutoff)
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -27,6 +57,7 @@ from src.controllers.generic_pathfinding_controller import GenericPathfindingCon
 from src.controllers.classic_dfs_controller import ClassicDFSController
 from src.controllers.astar_controller import AStarController
 from src.services.place_index_service import PlaceIndexService
+from config.settings import VISUALIZATION_COLORS, EXPLORED_LINE_WIDTH, EXPLORED_ALPHA, PRIMARY_LINE_WIDTH, ALTERNATIVE_LINE_WIDTH, TILE_CACHE_DIR
 
 
 class PathFinderGUI:
@@ -35,15 +66,24 @@ class PathFinderGUI:
         self.root.title("Path Finder - Addis Ababa")
         self.root.geometry("1400x800")
         
-        # Initialize place index (downloads + caches Addis Ababa place names)
-        self.place_index = PlaceIndexService()
-        
-        # Initialize controllers
-        self.bfs_controller = GenericPathfindingController()
-        self.dfs_controller = ClassicDFSController()
-        from core.addis_ababa_adapter import AddisAbabaAdapter
-        adapter = AddisAbabaAdapter()
-        self.astar_controller = AStarController(adapter)
+        # The place index (network downloads) and controllers (graph
+        # builds) are installed by a background warmup thread so the
+        # window paints immediately instead of freezing for seconds.
+        self.place_index = None
+        self.bfs_controller = None
+        self.dfs_controller = None
+        self.astar_controller = None
+        self._graph = None
+        self._csr = None
+        self._node_to_idx = None
+        self._node_x = None
+        self._node_y = None
+        self._all_edge_segments = None
+        self._base_edges_lc = None
+        # Rasterized base-map snapshot for blitting, plus the view limits
+        # it was captured at; stale once the user zooms or pans.
+        self._bg = None
+        self._bg_lims = None
         # Store last successful pathfinding result for web map visualization
         self.last_result = None
         
@@ -60,10 +100,11 @@ class PathFinderGUI:
             "Gotera", "Gotera Interchange", "Gotera Area",
             "Megenagna", "Megenagna Square", "Megenagna Area"
         ]
-        
-        # Combine static locations with dynamic OSM-based index for suggestions
-        osm_locations = self.place_index.get_all_names()
-        self.locations = list(dict.fromkeys(static_locations + osm_locations))
+        self._static_locations = static_locations
+
+        # Start with the static names only; the warmup thread merges in
+        # the OSM-based index once it has downloaded.
+        self._set_locations(static_locations)
         
         # Original location mapping for display
         self.original_locations = [
@@ -93,6 +134,13 @@ class PathFinderGUI:
         for original, vars in variations.items():
             for var in vars:
                 self.location_mapping[var.lower()] = original
+
+        # Fuzzy resolution runs SequenceMatcher against every mapping key;
+        # cache it per lowercased input since the mapping is fixed after
+        # __init__.
+        self._resolve_location = functools.lru_cache(maxsize=1024)(
+            self._resolve_location_uncached
+        )
         
         # Current algorithm
         self.current_algorithm = tk.StringVar(value="BFS")
@@ -102,10 +150,144 @@ class PathFinderGUI:
         self.end_listbox = None
         self.start_list_visible = False
         self.end_list_visible = False
+        # Pending debounced suggestion updates, one per entry.
+        self._pending_suggest = {'start': None, 'end': None}
         
         # Setup GUI
         self.setup_gui()
-        
+
+        # Build the pooled suggestion windows once, hidden; keystrokes
+        # then only toggle visibility instead of creating Toplevels.
+        self.start_list_window, self.start_listbox = self._create_listbox('start')
+        self.start_list_window.withdraw()
+        self.end_list_window, self.end_listbox = self._create_listbox('end')
+        self.end_list_window.withdraw()
+
+        # Heavy startup work (place-name downloads, graph construction)
+        # runs off the Tk thread; results are swapped in via root.after.
+        self.find_button.config(state="disabled")
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _set_locations(self, *sources):
+        """Build the location list and search indexes from name sources.
+
+        One ordered dict keyed by lowercase does dedup, the lowercase
+        list (keystroke scans re-lowering thousands of OSM names is what
+        made typing lag), and original-case recovery in a single pass.
+        The sorted copy of the keys backs O(log N) prefix queries.
+        """
+        self._locations_by_lower = {}
+        for name in itertools.chain(*sources):
+            self._locations_by_lower.setdefault(name.lower(), name)
+        self.locations = list(self._locations_by_lower.values())
+        self.locations_lower = list(self._locations_by_lower)
+        self._lower_to_original = self._locations_by_lower
+        self._sorted_lower = sorted(self._locations_by_lower)
+        # Word-start index: ("square", "meskel square") lets a query for
+        # "squ" surface multi-word names whose first word doesn't match.
+        self._word_index = sorted({
+            (word, low)
+            for low in self._locations_by_lower
+            for word in low.split()
+        })
+
+    def _warmup(self):
+        """Build the place index and controllers on a background thread."""
+        try:
+            place_index = PlaceIndexService()
+            bfs_controller = GenericPathfindingController()
+            dfs_controller = ClassicDFSController()
+            from core.addis_ababa_adapter import AddisAbabaAdapter
+            astar_controller = AStarController(AddisAbabaAdapter())
+
+            # Flatten the static road graph to CSR once so the algorithm
+            # layer can traverse NumPy arrays instead of nx dict-of-dicts.
+            # The arrays are cached next to the graphml, so warm starts
+            # skip the conversion walk entirely.
+            from core.csr_graph import CSRGraph
+            from config.settings import CSR_CACHE_DIR
+            csr = CSRGraph.load_or_build(
+                bfs_controller.domain_adapter.graph_model.graph, CSR_CACHE_DIR
+            )
+            bfs_controller.set_csr(csr)
+            dfs_controller.set_csr(csr)
+            astar_controller.set_csr(csr)
+        except Exception as e:
+            # Surface the failure on the Tk thread: swallowing it here
+            # left the Find button permanently disabled with no
+            # user-visible explanation.
+            self.root.after(0, self._warmup_failed, e)
+            return
+        self.root.after(
+            0,
+            self._install_controllers,
+            place_index,
+            bfs_controller,
+            dfs_controller,
+            astar_controller,
+        )
+
+    def _warmup_failed(self, error):
+        """Report a failed startup warmup on the Tk thread."""
+        print(f"Error during startup warmup: {error}")
+        self.ax.clear()
+        self.ax.text(0.5, 0.5, "Startup failed\nPath finding unavailable",
+                    ha='center', va='center', transform=self.ax.transAxes, fontsize=12)
+        self.ax.set_title("Addis Ababa Road Network", fontsize=14, fontweight='bold')
+        self.canvas.draw()
+        self.output_text.insert(
+            tk.END, f"✗ Startup failed: {error}\n", "error"
+        )
+        messagebox.showerror(
+            "Startup failed",
+            f"Could not load the road network:\n{error}\n\n"
+            "Path finding is unavailable. Check your connection and restart."
+        )
+
+    def _install_controllers(self, place_index, bfs_controller, dfs_controller, astar_controller):
+        """Swap in the warmed-up services on the Tk thread and go live."""
+        self.place_index = place_index
+        self.bfs_controller = bfs_controller
+        self.dfs_controller = dfs_controller
+        self.astar_controller = astar_controller
+        # Direct handle to the (immutable after load) road graph; every
+        # redraw used to chase controller -> adapter -> model attributes.
+        self._graph = bfs_controller.domain_adapter.graph_model.graph
+
+        # Node coordinate columns, sharing the CSR index order, so a path
+        # of node ids becomes two fancy-indexed gathers instead of
+        # per-node nested dict lookups when building segments.
+        csr = bfs_controller.domain_adapter.csr_graph
+        if csr is not None:
+            self._csr = csr
+            self._node_to_idx = csr.node_to_idx
+            # The CSR already holds fixed-point coordinates; dequantize
+            # once into the float columns matplotlib needs.
+            lats, lons = csr.coords_float()
+            self._node_x = lons.astype(np.float32)
+            self._node_y = lats.astype(np.float32)
+
+            # Full deduplicated edge list as one segment array, feeding
+            # the zoomed-in road overlay straight into _cull_segments.
+            counts = np.diff(csr.indptr).astype(np.int64)
+            us = np.repeat(np.arange(csr.num_nodes, dtype=np.int64), counts)
+            vs = csr.indices.astype(np.int64)
+            keep = us < vs
+            us, vs = us[keep], vs[keep]
+            segs = np.empty((len(us), 2, 2), dtype=np.float32)
+            segs[:, 0, 0] = self._node_x[us]
+            segs[:, 0, 1] = self._node_y[us]
+            segs[:, 1, 0] = self._node_x[vs]
+            segs[:, 1, 1] = self._node_y[vs]
+            self._all_edge_segments = segs
+
+        # Merge the OSM-based index into the suggestion list.
+        osm_locations = place_index.get_all_names()
+        self._set_locations(self._static_locations, osm_locations)
+
+        self.find_button.config(state="normal")
+        self.load_initial_map()
+
     def setup_gui(self):
         """Setup the main GUI layout."""
         # Main container
@@ -202,11 +384,23 @@ class PathFinderGUI:
         # Enable zoom with mouse wheel
         self.canvas.mpl_connect('scroll_event', self.on_scroll)
         self.canvas.mpl_connect('button_press_event', self.on_mouse_press)
+
+        # Level-of-detail road overlay: redrawn from the culled edge
+        # array whenever the view changes.
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
         
         # Store original view limits for reset
         self.original_xlim = None
         self.original_ylim = None
-        
+
+        # Route overlay artists drawn on top of the persistent base map;
+        # tracked so a new query removes them instead of clearing the axes.
+        self._route_artists = []
+        self._base_drawn = False
+        # Start/end markers live in one persistent scatter whose offsets
+        # are updated in place rather than new Line2D artists per query.
+        self._endpoints_sc = None
+
         # Load initial map
         self.load_initial_map()
         
@@ -225,44 +419,93 @@ class PathFinderGUI:
         self.output_text.tag_configure("info", foreground="blue", font=("Arial", 10, "bold"))
         self.output_text.tag_configure("header", font=("Arial", 12, "bold"))
         
+    def _basemap_cache_path(self, graph):
+        """Return the .npz path for the cached warped tile raster."""
+        key = hashlib.md5(
+            (str(graph.number_of_edges()) + str(graph.number_of_nodes())).encode()
+        ).hexdigest()
+        # v3: the cache holds the warped tile array plus its data extent.
+        # Earlier versions rasterized the whole figure with savefig, so
+        # the map pixels only filled the axes sub-region of the PNG and
+        # imshow-ing it onto the data extent shifted the basemap under
+        # the route overlays (with the baked-in title drawn twice).
+        base = Path(tempfile.gettempdir()) / f"aa_basemap_v3_{key}"
+        return base.with_suffix(".npz")
+
     def load_initial_map(self):
         """Load the initial Addis Ababa map."""
+        if self.bfs_controller is None:
+            # Warmup thread hasn't delivered the graph yet; show a
+            # placeholder and let _install_controllers call back in.
+            self.ax.clear()
+            self.ax.text(0.5, 0.5, "Loading map…",
+                        ha='center', va='center', transform=self.ax.transAxes, fontsize=14)
+            self.ax.set_title("Addis Ababa Road Network", fontsize=14, fontweight='bold')
+            self.canvas.draw()
+            return
         try:
             # Get the graph from BFS controller's domain adapter
-            graph = self.bfs_controller.domain_adapter.graph_model.graph
+            graph = self._graph
 
-            # Plot the road network
-            self.ax.clear()
-            ox.plot_graph(
-                graph,
-                ax=self.ax,
-                show=False,
-                close=False,
-                node_size=0,
-                edge_color="orange",
-                edge_linewidth=1.0,
-                bgcolor="white",
-            )
-
-            # Add real map tiles behind the graph using OpenStreetMap via contextily
-            try:
-                ctx.add_basemap(
-                    self.ax,
-                    crs="EPSG:4326",  # graph is in lat/lon
-                    source=ctx.providers.OpenStreetMap.Mapnik,
+            # The first launch downloads and warps OSM tiles; cache the
+            # warped array with its extent (keyed by graph size) so
+            # later launches just imshow it — same call as the cold
+            # path, so overlays in data coordinates line up exactly.
+            npz_path = self._basemap_cache_path(graph)
+            cached = None
+            if npz_path.exists():
+                try:
+                    with np.load(npz_path) as data:
+                        cached = {name: data[name] for name in
+                                  ("img", "ext", "xlim", "ylim")}
+                except Exception as cache_err:
+                    print(f"Warning: could not read basemap cache: {cache_err}")
+            if cached is not None:
+                self.ax.clear()
+                self._base_edges_lc = None
+                self._endpoints_sc = None
+                self.ax.imshow(
+                    cached["img"], extent=tuple(cached["ext"]),
+                    zorder=0, aspect="auto",
                 )
-            except Exception as tile_err:
-                # If tiles fail to load (offline, rate limit, etc.), continue with graph only
-                print(f"Warning: could not load basemap tiles: {tile_err}")
+                self.ax.set_xlim(tuple(cached["xlim"]))
+                self.ax.set_ylim(tuple(cached["ylim"]))
+                self.ax.set_title("Addis Ababa Road Network (with OSM basemap)", fontsize=14, fontweight='bold')
+                self.original_xlim = self.ax.get_xlim()
+                self.original_ylim = self.ax.get_ylim()
+                self._route_artists = []
+                self._base_drawn = True
+                self.canvas.draw()
+                self._capture_base_background()
+                return
+
+            # First paint is tiles-only: stroking every road edge via
+            # ox.plot_graph dominated startup, and at city zoom the
+            # edges are sub-pixel anyway. The road overlay appears
+            # lazily once the user zooms in (_on_xlim_changed).
+            self.ax.clear()
+            self._base_edges_lc = None
+            self._endpoints_sc = None
+            pad_x =(self._node_x.max() - self._node_x.min()) * 0.02
+            pad_y = (self._node_y.max() - self._node_y.min()) * 0.02
+            self.ax.set_xlim(self._node_x.min() - pad_x, self._node_x.max() + pad_x)
+            self.ax.set_ylim(self._node_y.min() - pad_y, self._node_y.max() + pad_y)
+            self.ax.set_facecolor("white")
 
             self.ax.set_title("Addis Ababa Road Network (with OSM basemap)", fontsize=14, fontweight='bold')
-            
+
             # Store original limits for reset functionality
             self.original_xlim = self.ax.get_xlim()
             self.original_ylim = self.ax.get_ylim()
-            
+            self._route_artists = []
+            self._base_drawn = True
+
+            # Show the road network immediately; the OSM tiles arrive
+            # from a worker thread and slide in underneath when ready.
             self.canvas.draw()
-            
+            self._capture_base_background()
+            self._add_basemap_async(npz_path)
+
         except Exception as e:
             print(f"Error loading map: {e}")
             # Create empty plot
@@ -274,6 +517,68 @@ class PathFinderGUI:
             self.original_ylim = self.ax.get_ylim()
             self.canvas.draw()
     
+    def _add_basemap_async(self, npz_path):
+        """Fetch OSM tiles off the UI thread and draw them when ready."""
+        xlim = self.original_xlim
+        ylim = self.original_ylim
+
+        def fetch():
+            try:
+                # Deferred import: contextily pulls in the geo stack and
+                # is skipped entirely when the rendered-PNG cache hits.
+                import contextily as ctx
+                # Persistent tile cache: contextily otherwise re-requests
+                # every tile from the (rate-limited) OSM servers per run.
+                # A fixed zoom caps the tile count for the city bbox.
+                ctx.set_cache_dir(str(TILE_CACHE_DIR))
+                # bounds2img fetches the whole tile grid over 16
+                # concurrent connections; the fetches are I/O bound, so
+                # the pool is roughly N× faster than add_basemap's
+                # serial loop — and running here it never blocks Tk.
+                img, ext = ctx.bounds2img(
+                    xlim[0], ylim[0], xlim[1], ylim[1],
+                    zoom=13,
+                    source=ctx.providers.OpenStreetMap.Mapnik,
+                    ll=True,
+                    n_connections=16,
+                )
+                # bounds2img returns Web Mercator; the axes are lat/lon.
+                img, ext = ctx.warp_tiles(img, ext, t_crs="EPSG:4326")
+            except Exception as tile_err:
+                # If tiles fail to load (offline, rate limit, etc.),
+                # continue with graph only
+                print(f"Warning: could not load basemap tiles: {tile_err}")
+                self.root.after(0, self._finish_base_render)
+                return
+            self.root.after(0, self._install_basemap, img, ext, npz_path)
+
+        threading.Thread(target=fetch, daemon=True).start()
+
+    def _install_basemap(self, img, ext, npz_path):
+        """Draw fetched tiles under the road edges (Tk main thread)."""
+        self.ax.imshow(img, extent=ext, zorder=0, aspect="auto")
+        self.ax.set_xlim(self.original_xlim)
+        self.ax.set_ylim(self.original_ylim)
+
+        # Persist the warped tile array and its extents for the next
+        # launch; failures here only cost the cache, not the map.
+        try:
+            np.savez_compressed(
+                npz_path,
+                img=img,
+                ext=np.asarray(ext, dtype=np.float64),
+                xlim=np.asarray(self.original_xlim, dtype=np.float64),
+                ylim=np.asarray(self.original_ylim, dtype=np.float64),
+            )
+        except Exception as cache_err:
+            print(f"Warning: could not cache basemap tiles: {cache_err}")
+        self._finish_base_render()
+
+    def _finish_base_render(self):
+        """Finalize the base render: redraw and recapture the backdrop."""
+        self.canvas.draw()
+        self._capture_base_background()
+
     def on_scroll(self, event):
         """Handle mouse wheel zoom."""
         if event.inaxes != self.ax:
@@ -282,39 +587,26 @@ class PathFinderGUI:
         # Get current x and y limits
         xlim = self.ax.get_xlim()
         ylim = self.ax.get_ylim()
-        
+
         # Get mouse position in data coordinates
         xdata = event.xdata
         ydata = event.ydata
-        
-        # Determine zoom direction
-        if event.button == 'up':
-            # Zoom in
-            scale_factor = 0.9
-        else:
-            # Zoom out
-            scale_factor = 1.1
-            
-        # Calculate new limits
-        new_width = (xlim[1] - xlim[0]) * scale_factor
-        new_height = (ylim[1] - ylim[0]) * scale_factor
-        
-        # Center on mouse position
-        relx = (xdata - xlim[0]) / (xlim[1] - xlim[0])
-        rely = (ydata - ylim[0]) / (ylim[1] - ylim[0])
-        
-        new_xlim = [
-            xdata - new_width * relx,
-            xdata + new_width * (1 - relx)
-        ]
-        new_ylim = [
-            ydata - new_height * rely,
-            ydata + new_height * (1 - rely)
-        ]
-        
-        # Apply new limits
-        self.ax.set_xlim(new_xlim)
-        self.ax.set_ylim(new_ylim)
+
+        # Zoom in on wheel-up, out on wheel-down
+        scale_factor = 0.9 if event.button == 'up' else 1.1
+
+        # Scale about the cursor. Trackpads fire this at 60-120 Hz, so
+        # keep it to a handful of multiply-adds with each span computed
+        # once.
+        w = xlim[1] - xlim[0]
+        h = ylim[1] - ylim[0]
+        relx = (xdata - xlim[0]) / w
+        rely = (ydata - ylim[0]) / h
+        nw = w * scale_factor
+        nh = h * scale_factor
+
+        self.ax.set_xlim(xdata - nw * relx, xdata + nw * (1 - relx))
+        self.ax.set_ylim(ydata - nh * rely, ydata + nh * (1 - rely))
         self.canvas.draw_idle()
     
     def on_mouse_press(self, event):
@@ -337,21 +629,38 @@ class PathFinderGUI:
         """Get the original location name from user input."""
         if not location:
             return None
-            
+        # location_mapping never changes after __init__, so the cached
+        # resolver stays valid; repeat queries for the same name skip the
+        # SequenceMatcher pass entirely.
+        return self._resolve_location(location.lower())
+
+    def _resolve_location_uncached(self, loc_lower):
+        """Resolve a lowercased input to an original location name."""
         # Check for exact match first
-        loc_lower = location.lower()
         if loc_lower in self.location_mapping:
             return self.location_mapping[loc_lower]
-            
+
         # Try to find close matches
-        matches = get_close_matches(loc_lower, self.location_mapping.keys(), n=1, cutoff=0.5)
+        matches = fuzzy_matches(loc_lower, list(self.location_mapping.keys()), n=1, cutoff=0.5)
         if matches:
             return self.location_mapping[matches[0]]
-            
+
         return None
         
     def _on_entry_key(self, entry_type):
         """Handle key input in location entries and manage suggestions."""
+        # Trailing debounce: during a typing burst only the final entry
+        # state matters, so cancel the pending update and reschedule.
+        pending = self._pending_suggest.get(entry_type)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._pending_suggest[entry_type] = self.root.after(
+            75, self._do_suggest, entry_type
+        )
+
+    def _do_suggest(self, entry_type):
+        """Run the (debounced) suggestion update for an entry."""
+        self._pending_suggest[entry_type] = None
         if entry_type == 'start':
             text = self.start_var.get().strip().lower()
         else:
@@ -366,12 +675,49 @@ class PathFinderGUI:
 
     def _update_search_suggestions(self, entry_type, current):
         """Update the search suggestions in real-time."""
-        # Find all locations that contain the current input
-        matches = [loc for loc in self.locations if current in loc.lower()]
+        # Prefix matches first: bisect into the sorted lowercase index and
+        # read off consecutive entries instead of scanning the whole list.
+        matches = []
+        start = bisect_left(self._sorted_lower, current)
+        for low in self._sorted_lower[start:start + 10]:
+            if not low.startswith(current):
+                break
+            matches.append(self._lower_to_original[low])
+
+        # Second pass over the word-start index, so "square" still finds
+        # "Meskel Square" without resorting to a full substring scan.
+        if len(matches) < 10:
+            seen = set(matches)
+            start = bisect_left(self._word_index, (current,))
+            for word, low in self._word_index[start:start + 50]:
+                if not word.startswith(current):
+                    break
+                loc = self._lower_to_original[low]
+                if loc not in seen:
+                    seen.add(loc)
+                    matches.append(loc)
+                    if len(matches) >= 10:
+                        break
 
-        # If no matches, try fuzzy matching
+        # Fall back to an infix scan only when no name starts with the
+        # input; stop as soon as the listbox is full.
         if not matches:
-            matches = get_close_matches(current, self.locations, n=5, cutoff=0.4)
+            for low, loc in self._locations_by_lower.items():
+                if current in low:
+                    matches.append(loc)
+                    if len(matches) >= 10:
+                        break
+
+        # Top up a short list with fuzzy matches (typo tolerance) while
+        # keeping exact prefix/substring hits first.
+        if len(matches) < 10:
+            close = fuzzy_matches(current, self.locations_lower,
+                                  n=10 - len(matches), cutoff=0.4)
+            seen = set(matches)
+            matches.extend(
+                loc for loc in (self._locations_by_lower[low] for low in close)
+                if loc not in seen
+            )
 
         if not matches:
             # Nothing to show
@@ -409,17 +755,25 @@ class PathFinderGUI:
         
     def _update_listbox(self, entry_type, suggestions):
         """Update the listbox with new suggestions."""
+        # The Toplevels are created once and pooled; showing is a
+        # deiconify + reposition instead of a fresh window allocation.
         if entry_type == 'start':
             if not self.start_listbox:
                 self.start_list_window, self.start_listbox = self._create_listbox('start')
-                self.start_list_visible = True
-            listbox = self.start_listbox
+            window, listbox, entry = self.start_list_window, self.start_listbox, self.start_entry
+            self.start_list_visible = True
         else:
             if not self.end_listbox:
                 self.end_list_window, self.end_listbox = self._create_listbox('end')
-                self.end_list_visible = True
-            listbox = self.end_listbox
-            
+            window, listbox, entry = self.end_list_window, self.end_listbox, self.end_entry
+            self.end_list_visible = True
+
+        # Track the entry in case the window moved or resized.
+        x = entry.winfo_rootx()
+        y = entry.winfo_rooty() + entry.winfo_height()
+        window.geometry(f"{entry.winfo_width()}x150+{x}+{y}")
+        window.deiconify()
+
         # Clear and update listbox
         listbox.delete(0, tk.END)
         for suggestion in suggestions:
@@ -453,19 +807,19 @@ class PathFinderGUI:
                 
     def _hide_search_list(self, entry_type):
         """Hide the search list when entry loses focus."""
+        # Withdraw rather than destroy: the pooled window (and its font
+        # metrics, bindings, ...) is reused on the next keystroke.
         if entry_type == 'start' and hasattr(self, 'start_list_window'):
             try:
-                self.start_list_window.destroy()
-            except:
+                self.start_list_window.withdraw()
+            except tk.TclError:
                 pass
-            self.start_listbox = None
             self.start_list_visible = False
         elif entry_type == 'end' and hasattr(self, 'end_list_window'):
             try:
-                self.end_list_window.destroy()
-            except:
+                self.end_list_window.withdraw()
+            except tk.TclError:
                 pass
-            self.end_listbox = None
             self.end_list_visible = False
             
     def find_path(self):
@@ -556,137 +910,167 @@ class PathFinderGUI:
             # Re-enable button
             self.root.after(0, lambda: self.find_button.config(state="normal"))
             
+    def _flush_output(self, chunks):
+        """Insert accumulated (text, tag) chunks in one pass on the Tk thread."""
+        for text, tag in chunks:
+            if tag:
+                self.output_text.insert(tk.END, text, tag)
+            else:
+                self.output_text.insert(tk.END, text)
+
     def _display_bfs_result(self, result, start, end, algorithm):
         """Display BFS/A* result."""
-        self.root.after(0, lambda: self.output_text.insert(tk.END, f"=== {algorithm} RESULTS ===\n\n", "header"))
-        
+        # Accumulate every line locally and cross into the Tk event loop
+        # once, instead of scheduling one root.after per line.
+        chunks = [(f"=== {algorithm} RESULTS ===\n\n", "header")]
+
         if result["success"]:
             paths = result["paths"]
             if paths:
                 # Display path information
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Found {len(paths)} optimal paths\n", "success"))
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Primary path: {len(paths[0])-1} steps\n", "info"))
-                
+                chunks.append((f"✓ Found {len(paths)} optimal paths\n", "success"))
+                chunks.append((f"✓ Primary path: {len(paths[0])-1} steps\n", "info"))
+
                 if len(paths) > 1:
-                    self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ {len(paths)-1} alternative paths\n", "info"))
-                
+                    chunks.append((f"✓ {len(paths)-1} alternative paths\n", "info"))
+
                 # Display route
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"\nRoute: {result.get('start_node', 'Unknown')} to {result.get('goal_node', 'Unknown')}\n"))
-                
+                chunks.append((f"\nRoute: {result.get('start_node', 'Unknown')} to {result.get('goal_node', 'Unknown')}\n", None))
+
+                self.root.after(0, self._flush_output, chunks)
+
                 # Visualize paths
-                self.root.after(0, self._visualize_paths, result)
-                
+                self.root.after(0, self._visualize_paths, result, algorithm)
+                return
             else:
-                self.root.after(0, lambda: self.output_text.insert(tk.END, "No paths found\n", "error"))
+                chunks.append(("No paths found\n", "error"))
         else:
-            self.root.after(0, lambda: self.output_text.insert(tk.END, f"✗ {result.get('message', 'Unknown error')}\n", "error"))
-            
+            chunks.append((f"✗ {result.get('message', 'Unknown error')}\n", "error"))
+
+        self.root.after(0, self._flush_output, chunks)
+
     def _display_dfs_result(self, result, start, end):
         """Display Classic DFS result."""
-        self.root.after(0, lambda: self.output_text.insert(tk.END, "=== CLASSIC DFS RESULTS ===\n\n", "header"))
-        
+        chunks = [("=== CLASSIC DFS RESULTS ===\n\n", "header")]
+
         if result["success"]:
             paths = result["paths"]
             if paths:
                 # Display DFS-specific information
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Found {len(paths)} paths\n", "success"))
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Nodes explored: {len(result.get('visited_nodes', [])):,}\n", "info"))
-                
+                chunks.append((f"✓ Found {len(paths)} paths\n", "success"))
+                chunks.append((f"✓ Nodes explored: {len(result.get('visited_nodes', [])):,}\n", "info"))
+
                 # Find shortest path
                 shortest_idx = min(range(len(paths)), key=lambda i: len(paths[i]))
                 shortest_length = len(paths[shortest_idx]) - 1
-                
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Shortest path: {shortest_length} steps (Path {shortest_idx + 1})\n", "info"))
-                
+
+                chunks.append((f"✓ Shortest path: {shortest_length} steps (Path {shortest_idx + 1})\n", "info"))
+
                 # Display all path details
-                self.root.after(0, lambda: self.output_text.insert(tk.END, "\nPATH DETAILS:\n", "header"))
+                chunks.append(("\nPATH DETAILS:\n", "header"))
                 for i, path in enumerate(paths):
                     path_length = len(path) - 1
                     if i == shortest_idx:
-                        self.root.after(0, lambda i=i, path_length=path_length: 
-                                       self.output_text.insert(tk.END, f"PRIMARY: {path_length} steps\n", "success"))
+                        chunks.append((f"PRIMARY: {path_length} steps\n", "success"))
                     else:
-                        self.root.after(0, lambda i=i, path_length=path_length: 
-                                       self.output_text.insert(tk.END, f"ALT {i}: {path_length} steps\n"))
-                
+                        chunks.append((f"ALT {i}: {path_length} steps\n", None))
+
+                self.root.after(0, self._flush_output, chunks)
+
                 # Visualize paths
-                self.root.after(0, self._visualize_paths, result)
-                
+                self.root.after(0, self._visualize_paths, result, "DFS")
+                return
             else:
-                self.root.after(0, lambda: self.output_text.insert(tk.END, "No paths found\n", "error"))
+                chunks.append(("No paths found\n", "error"))
         else:
-            self.root.after(0, lambda: self.output_text.insert(tk.END, f"✗ {result.get('message', 'Unknown error')}\n", "error"))
-            
+            chunks.append((f"✗ {result.get('message', 'Unknown error')}\n", "error"))
+
+        self.root.after(0, self._flush_output, chunks)
+
     def _display_astar_result(self, result, start, end):
         """Display A* result."""
-        self.root.after(0, lambda: self.output_text.insert(tk.END, "=== A* RESULTS ===\n\n", "header"))
-        
+        chunks = [("=== A* RESULTS ===\n\n", "header")]
+
         if result["success"]:
             paths = result["paths"]
             if paths:
                 # Display A*-specific information
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Found {len(paths)} optimal paths\n", "success"))
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Nodes explored: {len(result.get('visited_nodes', [])):,}\n", "info"))
-                
+                chunks.append((f"✓ Found {len(paths)} optimal paths\n", "success"))
+                chunks.append((f"✓ Nodes explored: {len(result.get('visited_nodes', [])):,}\n", "info"))
+
                 # Display heuristic weight if available
                 heuristic_weight = result.get('heuristic_weight', 1.0)
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Heuristic weight: {heuristic_weight}\n", "info"))
-                
+                chunks.append((f"✓ Heuristic weight: {heuristic_weight}\n", "info"))
+
                 # Find shortest path
                 shortest_idx = min(range(len(paths)), key=lambda i: len(paths[i]))
                 shortest_length = len(paths[shortest_idx]) - 1
-                
-                self.root.after(0, lambda: self.output_text.insert(tk.END, f"✓ Shortest path: {shortest_length} steps (Path {shortest_idx + 1})\n", "info"))
-                
+
+                chunks.append((f"✓ Shortest path: {shortest_length} steps (Path {shortest_idx + 1})\n", "info"))
+
                 # Display all path details
-                self.root.after(0, lambda: self.output_text.insert(tk.END, "\nPATH DETAILS:\n", "header"))
+                chunks.append(("\nPATH DETAILS:\n", "header"))
                 for i, path in enumerate(paths):
                     path_length = len(path) - 1
                     if i == shortest_idx:
-                        self.root.after(0, lambda i=i, path_length=path_length: 
-                                       self.output_text.insert(tk.END, f"PRIMARY: {path_length} steps\n", "success"))
+                        chunks.append((f"PRIMARY: {path_length} steps\n", "success"))
                     else:
-                        self.root.after(0, lambda i=i, path_length=path_length: 
-                                       self.output_text.insert(tk.END, f"ALT {i}: {path_length} steps\n"))
-                
+                        chunks.append((f"ALT {i}: {path_length} steps\n", None))
+
+                self.root.after(0, self._flush_output, chunks)
+
                 # Visualize paths
-                self.root.after(0, self._visualize_paths, result)
-                
+                self.root.after(0, self._visualize_paths, result, "A*")
+                return
             else:
-                self.root.after(0, lambda: self.output_text.insert(tk.END, "No paths found\n", "error"))
+                chunks.append(("No paths found\n", "error"))
         else:
-            self.root.after(0, lambda: self.output_text.insert(tk.END, f"✗ {result.get('message', 'Unknown error')}\n", "error"))
+            chunks.append((f"✗ {result.get('message', 'Unknown error')}\n", "error"))
+
+        self.root.after(0, self._flush_output, chunks)
             
-    def _visualize_paths(self, result):
+    def _capture_base_background(self):
+        """Snapshot the freshly drawn base map for blit-based updates."""
+        try:
+            # Figure bbox, not axes bbox, so the title region is covered
+            # too (it changes with the algorithm name).
+            self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+            self._bg_lims = (self.ax.get_xlim(), self.ax.get_ylim())
+        except Exception:
+            self._bg = None
+            self._bg_lims = None
+
+    def _clear_route_overlay(self):
+        """Remove the previous query's overlay artists from the axes."""
+        for artist in self._route_artists:
+            try:
+                artist.remove()
+            except ValueError:
+                pass  # already detached (e.g. by an axes clear)
+        self._route_artists = []
+        if self._endpoints_sc is not None:
+            self._endpoints_sc.set_visible(False)
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+
+    def _visualize_paths(self, result, algorithm):
         """Visualize paths on the map using original terminal visualization style."""
         try:
             # Store current zoom level
             current_xlim = self.ax.get_xlim()
             current_ylim = self.ax.get_ylim()
-            
-            # Clear previous plot
-            self.ax.clear()
-            
+
+            # The base map (edges + tiles) persists across queries; only
+            # the previous route overlay is removed and redrawn, so the
+            # per-query cost scales with the path, not the road network.
+            if not self._base_drawn:
+                self.load_initial_map()
+            self._clear_route_overlay()
+
             # Get graph and visualization settings
-            graph = self.bfs_controller.domain_adapter.graph_model.graph
-            from config.settings import VISUALIZATION_COLORS, EXPLORED_LINE_WIDTH, EXPLORED_ALPHA, PRIMARY_LINE_WIDTH, ALTERNATIVE_LINE_WIDTH
-            
-            # Plot base graph (lightgray edges)
-            ox.plot_graph(graph, ax=self.ax, show=False, close=False, node_size=0, 
-                         edge_linewidth=0.3, edge_color=VISUALIZATION_COLORS["base_edges"])
-            
-            # Add real map tiles behind the graph (same as initial map)
-            try:
-                import contextily as ctx
-                ctx.add_basemap(
-                    self.ax,
-                    crs="EPSG:4326",  # graph is in lat/lon
-                    source=ctx.providers.OpenStreetMap.Mapnik,
-                )
-            except Exception as tile_err:
-                print(f"Warning: could not load basemap tiles: {tile_err}")
-                # Continue with graph only if tiles fail
-            
+            graph = self._graph
+
             # Plot explored nodes (blue) - if available in result
             visited_nodes = result.get("visited_nodes", set())
             if visited_nodes:
@@ -706,19 +1090,26 @@ class PathFinderGUI:
                 if len(primary_path) > 1:
                     self._draw_path_gui(primary_path, graph, VISUALIZATION_COLORS["primary"], PRIMARY_LINE_WIDTH)
                     
-                    # Add start and end markers
+                    # Add start and end markers; the endpoints came off
+                    # the found path, so they are in the graph.
                     start_node, end_node = primary_path[0], primary_path[-1]
-                    if graph.has_node(start_node) and graph.has_node(end_node):
-                        start_y, start_x = graph.nodes[start_node]['y'], graph.nodes[start_node]['x']
-                        end_y, end_x = graph.nodes[end_node]['y'], graph.nodes[end_node]['x']
-                        
-                        self.ax.plot(start_x, start_y, 'go', markersize=10, label='Start')
-                        self.ax.plot(end_x, end_y, 'ro', markersize=10, label='End')
+                    start_y, start_x = graph.nodes[start_node]['y'], graph.nodes[start_node]['x']
+                    end_y, end_x = graph.nodes[end_node]['y'], graph.nodes[end_node]['x']
+
+                    offsets = np.array([[start_x, start_y], [end_x, end_y]])
+                    if self._endpoints_sc is None:
+                        self._endpoints_sc = self.ax.scatter(
+                            offsets[:, 0], offsets[:, 1], s=100,
+                            c=['green', 'red'], zorder=6,
+                        )
+                    else:
+                        self._endpoints_sc.set_offsets(offsets)
+                        self._endpoints_sc.set_visible(True)
             
-            # Add title
-            algorithm = "BFS" if "BFS" in str(result) else "DFS"
+            # Add title; the caller says which algorithm ran, so no
+            # stringification of the whole result dict to guess a label.
             self.ax.set_title(f"Path Finding - {algorithm} Algorithm", fontsize=14, fontweight='bold')
-            
+
             # Add legend with proper colors
             self._add_legend_gui(paths, VISUALIZATION_COLORS, visited_nodes)
             
@@ -726,16 +1117,37 @@ class PathFinderGUI:
             self.ax.set_xlim(current_xlim)
             self.ax.set_ylim(current_ylim)
             
-            # Refresh canvas
-            self.canvas.draw()
-            
+            # Refresh canvas: when the view still matches the captured
+            # background, restore the base-map pixels and blit only the
+            # route artists; a full draw is only needed after zoom/pan.
+            if (
+                self._bg is not None
+                and self._bg_lims == (current_xlim, current_ylim)
+            ):
+                self.canvas.restore_region(self._bg)
+                for artist in self._route_artists:
+                    self.ax.draw_artist(artist)
+                if self._endpoints_sc is not None and self._endpoints_sc.get_visible():
+                    self.ax.draw_artist(self._endpoints_sc)
+                self.ax.draw_artist(self.ax.title)
+                legend = self.ax.get_legend()
+                if legend is not None:
+                    self.ax.draw_artist(legend)
+                self.canvas.blit(self.fig.bbox)
+            else:
+                self.canvas.draw()
+
         except Exception as e:
             print(f"Visualization error: {e}")
             # Show error on plot
             self.ax.clear()
-            self.ax.text(0.5, 0.5, f"Visualization Error\n{str(e)}\n\nPath finding results\nare shown in the\noutput panel", 
+            self._route_artists = []
+            self._base_drawn = False  # base map was cleared; redraw next time
+            self._base_edges_lc = None
+            self._endpoints_sc = None
+            self._bg = None
+            self.ax.text(0.5, 0.5, f"Visualization Error\n{str(e)}\n\nPath finding results\nare shown in the\noutput panel",
                         ha='center', va='center', transform=self.ax.transAxes, fontsize=12)
-            algorithm = "BFS" if "BFS" in str(result) else "DFS"
             self.ax.set_title(f"Path Finding - {algorithm} Algorithm", fontsize=14, fontweight='bold')
             self.canvas.draw()
 
@@ -747,25 +1159,72 @@ class PathFinderGUI:
         current OSMnx version. It uses Folium directly, drawing the primary
         path (if available) over real OSM tiles.
         """
+        if self.bfs_controller is None:
+            messagebox.showinfo("Interactive Map", "Map data is still loading, please wait.")
+            return
+
+        graph = self._graph
+
+        # If we have a path result, prefer to center and zoom on that route
+        coords = []
+        if self.last_result and self.last_result.get("success") and self.last_result.get("paths"):
+            route_nodes = self.last_result["paths"][0]
+            if len(route_nodes) > 1:
+                for node in route_nodes:
+                    if node in graph.nodes:
+                        ndata = graph.nodes[node]
+                        # graph uses y=lat, x=lon
+                        coords.append((ndata["y"], ndata["x"]))
+
+        center = None
+        if not coords:
+            # No route yet: center on the graph itself
+            if len(graph.nodes) == 0:
+                messagebox.showwarning("Interactive Map", "Graph is empty, cannot build map.")
+                return
+
+            first_node = next(iter(graph.nodes))
+            center = (graph.nodes[first_node].get("y"), graph.nodes[first_node].get("x"))
+
+            if center[0] is None or center[1] is None:
+                messagebox.showwarning("Interactive Map", "Graph nodes have no coordinates.")
+                return
+
+        # Folium templates roughly a megabyte of Leaflet HTML through
+        # Jinja on save; do that on a worker so the window stays live,
+        # then hop back to Tk just to launch the browser.
+        threading.Thread(
+            target=self._build_web_map, args=(coords, center), daemon=True
+        ).start()
+
+    def _build_web_map(self, coords, center):
+        """Render the Folium map and open it (runs off the UI thread)."""
         try:
-            graph = self.bfs_controller.domain_adapter.graph_model.graph
-
-            # If we have a path result, prefer to center and zoom on that route
-            coords = []
-            if self.last_result and self.last_result.get("success") and self.last_result.get("paths"):
-                route_nodes = self.last_result["paths"][0]
-                if len(route_nodes) > 1:
-                    for node in route_nodes:
-                        if node in graph.nodes:
-                            ndata = graph.nodes[node]
-                            # graph uses y=lat, x=lon
-                            coords.append((ndata["y"], ndata["x"]))
+            # The HTML is a pure function of the route, so key the file
+            # by a hash of the coordinates: a repeat click on the same
+            # result just reopens the file already on disk, skipping the
+            # whole Folium/Jinja render.
+            key = hashlib.blake2b(
+                repr((coords, center)).encode(), digest_size=8
+            ).hexdigest()
+            html_path = Path(tempfile.gettempdir()) / f"aa_web_map_{key}.html"
+            if html_path.exists():
+                self.root.after(0, webbrowser.open, html_path.as_uri())
+                return
+
+            # Deferred import: folium's dependency tree only loads if the
+            # user actually opens the web map.
+            import folium
 
             if coords:
                 # Center on route centroid
                 avg_lat = sum(c[0] for c in coords) / len(coords)
                 avg_lng = sum(c[1] for c in coords) / len(coords)
-                fmap = folium.Map(location=[avg_lat, avg_lng], zoom_start=15, tiles="OpenStreetMap")
+                # prefer_canvas renders vector layers onto one canvas
+                # instead of an SVG DOM node per segment, which keeps
+                # pan/zoom smooth for long routes.
+                fmap = folium.Map(location=[avg_lat, avg_lng], zoom_start=15,
+                                  tiles="OpenStreetMap", prefer_canvas=True)
 
                 folium.PolyLine(
                     coords,
@@ -781,62 +1240,178 @@ class PathFinderGUI:
                 # Fit map bounds tightly to the route
                 fmap.fit_bounds(coords)
             else:
-                # No route yet: center on the graph itself
-                if len(graph.nodes) == 0:
-                    messagebox.showwarning("Interactive Map", "Graph is empty, cannot build map.")
-                    return
+                fmap = folium.Map(location=list(center), zoom_start=13,
+                                  tiles="OpenStreetMap", prefer_canvas=True)
 
-                first_node = next(iter(graph.nodes))
-                center_lat = graph.nodes[first_node].get("y")
-                center_lng = graph.nodes[first_node].get("x")
+            # A new route hashes to a new filename, so no cache-busting
+            # query string is needed for the browser to see fresh content.
+            fmap.save(str(html_path))
+            url = html_path.as_uri()
+        except Exception as e:
+            self.root.after(
+                0, messagebox.showerror, "Web Map Error", f"Could not open web map:\n{e}"
+            )
+            return
+        self.root.after(0, webbrowser.open, url)
+    
+    def _edge_segments(self, edges, graph):
+        """Pack (u, v) node pairs into an (N, 2, 2) segment array."""
+        idx = self._node_to_idx
+        if idx is not None:
+            # Gather endpoint coordinates from the precomputed columns in
+            # two fancy-indexed reads instead of per-node dict lookups.
+            # Edges come from paths over this same graph, so no
+            # per-endpoint membership check is needed.
+            pairs = [(idx[u], idx[v]) for u, v in edges]
+            if not pairs:
+                return np.empty((0, 2, 2), dtype=np.float32)
+            arr = np.asarray(pairs, dtype=np.int32)
+            segments = np.empty((len(pairs), 2, 2), dtype=np.float32)
+            segments[:, 0, 0] = self._node_x[arr[:, 0]]
+            segments[:, 0, 1] = self._node_y[arr[:, 0]]
+            segments[:, 1, 0] = self._node_x[arr[:, 1]]
+            segments[:, 1, 1] = self._node_y[arr[:, 1]]
+            return segments
 
-                if center_lat is None or center_lng is None:
-                    messagebox.showwarning("Interactive Map", "Graph nodes have no coordinates.")
-                    return
+        segments = np.empty((len(edges), 2, 2), dtype=np.float32)
+        nodes = graph.nodes
+        for i, (u, v) in enumerate(edges):
+            u_data, v_data = nodes[u], nodes[v]
+            segments[i, 0, 0] = u_data['x']
+            segments[i, 0, 1] = u_data['y']
+            segments[i, 1, 0] = v_data['x']
+            segments[i, 1, 1] = v_data['y']
+        return segments
 
-                fmap = folium.Map(location=[center_lat, center_lng], zoom_start=13, tiles="OpenStreetMap")
+    def _cull_segments(self, segments):
+        """Drop segments that cannot affect the current view.
 
-            # Save to a temporary HTML file with timestamp to avoid caching and open in default browser
-            import time
-            timestamp = int(time.time())
-            temp_filename = f"pathfinding_map_{timestamp}.html"
-            
-            with tempfile.NamedTemporaryFile(suffix=temp_filename, delete=False) as tmp:
-                fmap.save(tmp.name)
-                # Force browser to open fresh content by adding cache-busting parameter
-                webbrowser.open(f"file://{tmp.name}?t={timestamp}")
+        Off-screen edges fail a vectorized bbox test, and edges shorter
+        than ~one pixel at the current zoom collapse to invisible dots;
+        at city zoom the two cuts remove most of a large explored area
+        before Agg ever sees it. The culled edges reappear on the next
+        query if the user has zoomed out by then.
+        """
+        if not len(segments):
+            return segments
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        xs = segments[:, :, 0]
+        ys = segments[:, :, 1]
+        visible = (
+            (xs.max(axis=1) >= x0) & (xs.min(axis=1) <= x1)
+            & (ys.max(axis=1) >= y0) & (ys.min(axis=1) <= y1)
+        )
+        # One-pixel tolerance expressed in data units.
+        width_px = max(self.fig.get_size_inches()[0] * self.fig.dpi, 1.0)
+        tol = (x1 - x0) / width_px
+        tiny = (
+            (np.abs(xs[:, 1] - xs[:, 0]) < tol)
+            & (np.abs(ys[:, 1] - ys[:, 0]) < tol)
+        )
+        return segments[visible & ~tiny]
+
+    # View span (degrees longitude) under which individual roads are
+    # legible and worth stroking; the city overview stays tiles-only.
+    _EDGE_LOD_SPAN = 0.04
+
+    def _on_xlim_changed(self, ax):
+        """Stroke the road overlay only when zoomed in far enough."""
+        if self._all_edge_segments is None or not self._base_drawn:
+            return
+        x0, x1 = ax.get_xlim()
+        if abs(x1 - x0) > self._EDGE_LOD_SPAN:
+            if self._base_edges_lc is not None:
+                self._base_edges_lc.set_visible(False)
+            return
+        segments = self._cull_segments(self._all_edge_segments)
+        if self._base_edges_lc is None:
+            self._base_edges_lc = LineCollection(
+                segments, colors='orange', linewidths=1.0, zorder=1
+            )
+            self._base_edges_lc.set_antialiased(False)
+            self.ax.add_collection(self._base_edges_lc)
+        else:
+            self._base_edges_lc.set_segments(segments)
+            self._base_edges_lc.set_visible(True)
+
+    def _visited_segments(self, visited_nodes):
+        """Segments between visited nodes, read straight off the CSR rows.
+
+        graph.subgraph() materializes a NetworkX view with attribute
+        proxies just to enumerate edges; scanning the CSR rows of the
+        visited nodes and masking endpoints is a handful of array ops.
+        """
+        csr = self._csr
+        idx = self._node_to_idx
+        n = csr.num_nodes
+        rows = np.fromiter(
+            (idx[node] for node in visited_nodes), dtype=np.int64,
+            count=len(visited_nodes),
+        )
+        if not len(rows):
+            return np.empty((0, 2, 2), dtype=np.float32)
+        mask = np.zeros(n, dtype=bool)
+        mask[rows] = True
+
+        # Gather every outgoing edge of the visited rows in one shot.
+        starts = csr.indptr[rows].astype(np.int64)
+        counts = csr.indptr[rows + 1].astype(np.int64) - starts
+        total = int(counts.sum())
+        if not total:
+            return np.empty((0, 2, 2), dtype=np.float32)
+        offsets = np.repeat(
+            starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts
+        )
+        vs = csr.indices[np.arange(total) + offsets].astype(np.int64)
+        us = np.repeat(rows, counts)
+
+        # Keep edges internal to the visited set, deduplicated by
+        # unordered endpoint pair (the overlay has no direction).
+        keep = mask[vs]
+        us, vs = us[keep], vs[keep]
+        packed = np.unique(np.minimum(us, vs) * n + np.maximum(us, vs))
+        us, vs = packed // n, packed % n
+
+        segments = np.empty((len(packed), 2, 2), dtype=np.float32)
+        segments[:, 0, 0] = self._node_x[us]
+        segments[:, 0, 1] = self._node_y[us]
+        segments[:, 1, 0] = self._node_x[vs]
+        segments[:, 1, 1] = self._node_y[vs]
+        return segments
 
-        except Exception as e:
-            messagebox.showerror("Web Map Error", f"Could not open web map:\n{e}")
-    
     def _plot_explored_area_gui(self, visited_nodes, graph, line_width, alpha):
         """Plot explored area in blue - matches original terminal visualization."""
-        visited_nodes_list = list(visited_nodes)
-        if visited_nodes_list:
-            # Create subgraph of visited nodes
-            visited_subgraph = graph.subgraph(visited_nodes_list)
-            
-            # Plot edges in explored area
-            for u, v in visited_subgraph.edges():
-                if graph.has_node(u) and graph.has_node(v):
-                    u_data = graph.nodes[u]
-                    v_data = graph.nodes[v]
-                    x_coords = [u_data['x'], v_data['x']]
-                    y_coords = [u_data['y'], v_data['y']]
-                    self.ax.plot(x_coords, y_coords, 'b-', 
-                               linewidth=line_width, 
-                               alpha=alpha)
-    
+        if visited_nodes:
+            if self._csr is not None:
+                segments = self._visited_segments(visited_nodes)
+            else:
+                visited_subgraph = graph.subgraph(list(visited_nodes))
+                segments = self._edge_segments(list(visited_subgraph.edges()), graph)
+
+            # One LineCollection for the whole explored area: the Agg
+            # backend strokes it as a single batch instead of one Line2D
+            # per edge.
+            segments = self._cull_segments(segments)
+            if len(segments):
+                lc = LineCollection(segments, colors='blue',
+                                    linewidths=line_width, alpha=alpha)
+                # Hairlines under heavy alpha gain nothing from AA, and
+                # snapping to the pixel grid keeps the raster fast.
+                lc.set_antialiased(False)
+                lc.set_snap(True)
+                self.ax.add_collection(lc)
+                self._route_artists.append(lc)
+
     def _draw_path_gui(self, path, graph, color, linewidth):
         """Draw a single path on the map - matches original visualization."""
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i+1]
-            if graph.has_node(u) and graph.has_node(v):
-                u_data = graph.nodes[u]
-                v_data = graph.nodes[v]
-                x_coords = [u_data['x'], v_data['x']]
-                y_coords = [u_data['y'], v_data['y']]
-                self.ax.plot(x_coords, y_coords, color=color, linewidth=linewidth, alpha=0.9)
+        edges = list(zip(path[:-1], path[1:]))
+        segments = self._edge_segments(edges, graph)
+        if len(segments):
+            lc = LineCollection(segments, colors=color,
+                                linewidths=linewidth, alpha=0.9, zorder=5)
+            self.ax.add_collection(lc)
+            self._route_artists.append(lc)
     
     def _add_legend_gui(self, paths, colors, visited_nodes):
         """Add legend matching original terminal visualization."""
@@ -885,19 +1460,15 @@ class PathFinderGUI:
         """Check if a location exists in the available locations."""
         if not location_input:
             return False
-        
-        location_lower = location_input.lower()
-        
-        # Check exact matches
-        for location in self.locations:
-            if location.lower() == location_lower:
-                return True
-        
-        # Check if it's in the location mapping
-        if location_lower in self.location_mapping:
-            return True
-        
-        return False
+
+        # Both indexes are keyed by lowercase, so validation is two dict
+        # probes; no per-call scan over the location list and nothing to
+        # invalidate when the warmup thread swaps the index in.
+        location_lower = location_input.strip().lower()
+        return (
+            location_lower in self._locations_by_lower
+            or location_lower in self.location_mapping
+        )
     
     def _get_location_suggestions(self, user_input: str, max_suggestions: int = 4) -> List[str]:
         """Get location suggestions based on user input."""
@@ -906,46 +1477,47 @@ class PathFinderGUI:
         
         user_input_lower = user_input.lower()
         suggestions = []
-        
-        # Priority 1: Locations starting with the first 2-3 letters
-        for location in self.locations:
-            location_lower = location.lower()
-            if location_lower.startswith(user_input_lower):
-                suggestions.append(location)
+        seen = set()
+
+        # Priority 1: name-prefix matches off the sorted lowercase index
+        start = bisect_left(self._sorted_lower, user_input_lower)
+        for low in self._sorted_lower[start:start + max_suggestions]:
+            if not low.startswith(user_input_lower):
+                break
+            loc = self._lower_to_original[low]
+            suggestions.append(loc)
+            seen.add(loc)
+        if len(suggestions) >= max_suggestions:
+            return suggestions
+
+        # Priority 2: word-start matches off the (word, name) index
+        start = bisect_left(self._word_index, (user_input_lower,))
+        for word, low in self._word_index[start:start + 50]:
+            if not word.startswith(user_input_lower):
+                break
+            loc = self._lower_to_original[low]
+            if loc not in seen:
+                suggestions.append(loc)
+                seen.add(loc)
                 if len(suggestions) >= max_suggestions:
                     return suggestions
-        
-        # Priority 2: Locations containing the input as a word
-        for location in self.locations:
-            location_lower = location.lower()
-            words = location_lower.split()
-            for word in words:
-                if word.startswith(user_input_lower) and location not in suggestions:
-                    suggestions.append(location)
-                    if len(suggestions) >= max_suggestions:
-                        return suggestions
-        
+
         # Priority 3: Locations containing the input anywhere
-        for location in self.locations:
-            location_lower = location.lower()
-            if user_input_lower in location_lower and location not in suggestions:
-                suggestions.append(location)
+        for low, loc in self._locations_by_lower.items():
+            if user_input_lower in low and loc not in seen:
+                suggestions.append(loc)
+                seen.add(loc)
                 if len(suggestions) >= max_suggestions:
                     return suggestions
-        
+
         # Priority 4: Fuzzy matching for similar sounding names
-        if len(suggestions) < max_suggestions:
-            from difflib import get_close_matches
-            fuzzy_matches = get_close_matches(user_input_lower, [loc.lower() for loc in self.locations], 
-                                            n=max_suggestions - len(suggestions), cutoff=0.4)
-            
-            # Convert back to original case
-            for match in fuzzy_matches:
-                for location in self.locations:
-                    if location.lower() == match and location not in suggestions:
-                        suggestions.append(location)
-                        break
-        
+        close = fuzzy_matches(user_input_lower, self.locations_lower,
+                              n=max_suggestions - len(suggestions), cutoff=0.4)
+        suggestions.extend(
+            loc for loc in (self._locations_by_lower[low] for low in close)
+            if loc not in seen
+        )
+
         return suggestions[:max_suggestions]
     
     def _display_same_location_result(self, location: str, algorithm: str):
@@ -967,110 +1539,70 @@ class PathFinderGUI:
     def _visualize_same_location(self, location: str, algorithm: str):
         """Visualize a single location on the map."""
         try:
-            print(f"Debug: Starting visualization for location: {location}")
-            
             # Store current zoom level
             current_xlim = self.ax.get_xlim()
             current_ylim = self.ax.get_ylim()
-            print(f"Debug: Current limits - xlim: {current_xlim}, ylim: {current_ylim}")
-            
-            # Clear previous plot
-            self.ax.clear()
-            
-            # Get graph and visualization settings (same as working method)
-            try:
-                graph = self.bfs_controller.domain_adapter.graph_model.graph
-                print(f"Debug: Graph loaded successfully, nodes: {len(graph.nodes())}")
-            except Exception as graph_error:
-                print(f"Debug: Error loading graph: {graph_error}")
-                # Fallback: show simple map without graph
-                self._show_fallback_visualization(location, algorithm)
-                return
-            
-            from config.settings import VISUALIZATION_COLORS, EXPLORED_LINE_WIDTH, EXPLORED_ALPHA, PRIMARY_LINE_WIDTH, ALTERNATIVE_LINE_WIDTH
-            
-            # Plot base graph (lightgray edges) - same as working method
-            try:
-                ox.plot_graph(graph, ax=self.ax, show=False, close=False, node_size=0, 
-                             edge_linewidth=0.3, edge_color=VISUALIZATION_COLORS["base_edges"])
-                print("Debug: Base graph plotted successfully")
-                
-                # Add real map tiles behind the graph (same as initial map)
-                try:
-                    import contextily as ctx
-                    ctx.add_basemap(
-                        self.ax,
-                        crs="EPSG:4326",  # graph is in lat/lon
-                        source=ctx.providers.OpenStreetMap.Mapnik,
-                    )
-                    print("Debug: Basemap tiles added successfully")
-                except Exception as tile_err:
-                    print(f"Debug: Could not load basemap tiles: {tile_err}")
-                    # Continue with graph only if tiles fail
-                    
-            except Exception as plot_error:
-                print(f"Debug: Error plotting base graph: {plot_error}")
-                self._show_fallback_visualization(location, algorithm)
-                return
-            
+
+            # Reuse the persistent base map and only swap the overlay,
+            # same as _visualize_paths; replotting the graph and tiles
+            # from scratch froze the window for seconds.
+            if not self._base_drawn:
+                self.load_initial_map()
+            self._clear_route_overlay()
+
+            graph = self._graph
+
             # Try to get the node for this location
             node_found = False
             try:
                 node = self.bfs_controller.domain_adapter.get_nearest_node(location)
-                print(f"Debug: Found nearest node: {node}")
-                
+
                 if graph.has_node(node):
-                    print(f"Debug: Node {node} exists in graph")
                     # Get coordinates
                     y, x = graph.nodes[node]['y'], graph.nodes[node]['x']
-                    print(f"Debug: Node coordinates - x: {x}, y: {y}")
-                    
+
                     # Plot a single marker (both start and end at same point)
-                    self.ax.plot(x, y, 'go', markersize=15, label='Start = End', 
-                               markeredgecolor='darkgreen', markeredgewidth=2)
-                    print("Debug: Marker plotted successfully")
-                    
+                    self._route_artists.extend(
+                        self.ax.plot(x, y, 'go', markersize=15, label='Start = End',
+                                     markeredgecolor='darkgreen', markeredgewidth=2)
+                    )
+
                     # Add location label
-                    self.ax.annotate(location, (x, y), xytext=(10, 10), 
-                                   textcoords='offset points', fontsize=10,
-                                   bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
-                                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
-                    print("Debug: Annotation added successfully")
+                    self._route_artists.append(
+                        self.ax.annotate(location, (x, y), xytext=(10, 10),
+                                         textcoords='offset points', fontsize=10,
+                                         bbox=dict(boxstyle='round,pad=0.3', facecolor='yellow', alpha=0.7),
+                                         arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
+                    )
                     node_found = True
-                else:
-                    print(f"Debug: Node {node} not found in graph")
             except Exception as node_error:
                 print(f"Debug: Error getting node: {node_error}")
-            
+
             if not node_found:
                 # Node not found in graph
-                print("Debug: Using fallback text display")
-                self.ax.text(0.5, 0.5, f"Location: {location}\n(Node not found in graph)\n\nPath found: 0 steps", 
-                            ha='center', va='center', transform=self.ax.transAxes, 
-                            fontsize=12, bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
-            
+                self._route_artists.append(
+                    self.ax.text(0.5, 0.5, f"Location: {location}\n(Node not found in graph)\n\nPath found: 0 steps",
+                                 ha='center', va='center', transform=self.ax.transAxes,
+                                 fontsize=12, bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
+                )
+
             # Add title
             self.ax.set_title(f"Path Finding - {algorithm} Algorithm (Same Location)", fontsize=14, fontweight='bold')
-            
+
             # Add legend if we have a valid node
             if node_found:
-                try:
-                    from matplotlib.lines import Line2D
-                    marker_line = Line2D([0], [0], marker='o', color='w', markerfacecolor='g', 
-                                        markeredgecolor='darkgreen', markersize=10, label='Start = End')
-                    self.ax.legend(handles=[marker_line], loc='upper right')
-                    print("Debug: Legend added successfully")
-                except Exception as legend_error:
-                    print(f"Debug: Error adding legend: {legend_error}")
-            
+                from matplotlib.lines import Line2D
+                marker_line = Line2D([0], [0], marker='o', color='w', markerfacecolor='g',
+                                     markeredgecolor='darkgreen', markersize=10, label='Start = End')
+                self.ax.legend(handles=[marker_line], loc='upper right')
+
             # Restore zoom level
             self.ax.set_xlim(current_xlim)
             self.ax.set_ylim(current_ylim)
-            
+
             # Refresh canvas
             self.canvas.draw()
-            print("Debug: Canvas refreshed successfully")
-            
+
         except Exception as e:
             print(f"Debug: Major visualization error: {e}")
             self._show_fallback_visualization(location, algorithm)
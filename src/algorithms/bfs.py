@@ -3,7 +3,6 @@ Pure generic BFS algorithm implementation.
 Completely domain-agnostic and reusable for any graph type.
 """
 
-from collections import deque
 from typing import List, Set, Optional, Iterator
 from abc import ABC
 
@@ -19,6 +18,10 @@ class BFSAlgorithm(PathfindingAlgorithmInterface):
         """Initialize BFS with optional message handler."""
         self.message_handler = message_handler
         self._last_visited_nodes = set()
+        # Node -> degree, filled lazily; frontiers revisit hub nodes
+        # often enough that re-listing neighbors would dominate the
+        # alternation decision.
+        self._degree_cache: dict = {}
     
     def get_visited_nodes(self) -> set:
         """Get the set of visited nodes from the last search."""
@@ -49,18 +52,20 @@ class BFSAlgorithm(PathfindingAlgorithmInterface):
             if self.message_handler:
                 self.message_handler.handle_info("Start and goal are the same")
             return [[start]]
-        
-        # Build parent tree for path reconstruction
-        distance, parents, visited = self._build_parent_tree(start, goal, graph)
-        
-        if goal not in distance:
+
+        # Grow frontiers from both endpoints; each side only explores
+        # about half the search depth, which on a road graph cuts the
+        # edges touched from O(b^d) to roughly O(b^(d/2)).
+        meets, parents_f, parents_b, visited = self._bidirectional_parent_trees(
+            start, goal, graph
+        )
+        if not meets:
             if self.message_handler:
                 self.message_handler.handle_info("No path found between nodes")
             return []
-        
-        # Find all optimal paths
-        all_paths = []
-        self._backtrack_paths(goal, [goal], all_paths, start, max_paths or 1, parents)
+        all_paths = self._join_meet_paths(
+            meets, parents_f, parents_b, start, goal, max_paths or 1
+        )
         
         # Validate paths against constraints
         valid_paths = []
@@ -93,7 +98,7 @@ class BFSAlgorithm(PathfindingAlgorithmInterface):
             return
         
         # Build parent tree
-        distance, parents = self._build_parent_tree(start, goal, graph)
+        distance, parents, _ = self._build_parent_tree(start, goal, graph)
         
         if goal not in distance:
             return
@@ -107,56 +112,173 @@ class BFSAlgorithm(PathfindingAlgorithmInterface):
                 yield path
                 path_count += 1
     
+    def _bidirectional_parent_trees(self, start: int, goal: int,
+                                    graph: GraphInterface) -> tuple[list, dict, dict, set]:
+        """
+        Level-synchronized bidirectional BFS.
+
+        Alternates whole-level expansions of the smaller frontier until
+        the two settled regions touch. Returns (meets, parents_f,
+        parents_b, visited) where meets are all nodes on some optimal
+        path that both sides settled; every optimal path passes through
+        at least one of them, so the multi-path enumeration downstream
+        is preserved.
+        """
+        dist_f = {start: 0}
+        dist_b = {goal: 0}
+        parents_f = {start: []}
+        parents_b = {goal: []}
+        frontier_f = [start]
+        frontier_b = [goal]
+
+        meets: List[int] = []
+        while frontier_f and frontier_b and not meets:
+            if self._expansion_cost(frontier_f, graph) <= self._expansion_cost(frontier_b, graph):
+                frontier, dist, parents, dist_other = frontier_f, dist_f, parents_f, dist_b
+                forward = True
+            else:
+                frontier, dist, parents, dist_other = frontier_b, dist_b, parents_b, dist_f
+                forward = False
+
+            # Expand one complete level so every equal-length parent of
+            # the new layer is recorded before we test for a meeting.
+            next_level = []
+            level = dist[frontier[0]] + 1
+            for current in frontier:
+                for neighbor in graph.get_neighbors(current):
+                    if neighbor not in dist:
+                        dist[neighbor] = level
+                        parents[neighbor] = [current]
+                        next_level.append(neighbor)
+                    elif dist[neighbor] == level:
+                        parents[neighbor].append(current)
+
+            if forward:
+                frontier_f = next_level
+            else:
+                frontier_b = next_level
+
+            touched = [node for node in next_level if node in dist_other]
+            if touched:
+                best = min(dist_f[node] + dist_b[node] for node in touched)
+                meets = [
+                    node for node in touched
+                    if dist_f[node] + dist_b[node] == best
+                ]
+
+        visited = set(dist_f) | set(dist_b)
+        return meets, parents_f, parents_b, visited
+
+    def _expansion_cost(self, frontier: List[int], graph: GraphInterface) -> int:
+        """
+        Cost of expanding a frontier: its total out-degree.
+
+        Greedy alternation (Borassi-Natale): frontier size alone
+        undercounts a layer sitting on a high-degree hub, so the side
+        with the smaller summed degree — the number of edges the
+        expansion will actually scan — is expanded instead.
+        """
+        cache = self._degree_cache
+        cost = 0
+        for node in frontier:
+            degree = cache.get(node)
+            if degree is None:
+                degree = cache[node] = len(graph.get_neighbors(node))
+            cost += degree
+        return cost
+
+    def _join_meet_paths(self, meets: List[int], parents_f: dict, parents_b: dict,
+                         start: int, goal: int, max_paths: int) -> List[List[int]]:
+        """Splice forward and backward half-paths at each meeting node."""
+        all_paths: List[List[int]] = []
+        seen = set()
+        for meet in meets:
+            halves_f: List[List[int]] = []
+            self._backtrack_paths(meet, [meet], halves_f, start, max_paths, parents_f)
+            halves_b: List[List[int]] = []
+            self._backtrack_paths(meet, [meet], halves_b, goal, max_paths, parents_b)
+            for front in halves_f:
+                for back in halves_b:
+                    # Backward halves run goal -> meet; one reversed
+                    # slice flips and drops the shared meet node.
+                    path = front + back[-2::-1]
+                    key = tuple(path)
+                    if key not in seen:  # one path can cross several meets
+                        seen.add(key)
+                        all_paths.append(path)
+                        if len(all_paths) >= max_paths:
+                            return all_paths
+        return all_paths
+
     def _build_parent_tree(self, start: int, goal: int, graph: GraphInterface) -> tuple[dict, dict, set]:
         """Build parent tree for path reconstruction."""
-        queue = deque([start])
-        visited = {start}
+        # List + head cursor instead of a deque: the queue only ever
+        # grows, so an indexed read replaces popleft's block juggling,
+        # and the distance table doubles as the visited set.
+        queue = [start]
+        head = 0
         distance = {start: 0}
         parents = {start: []}
-        
-        while queue:
-            current = queue.popleft()
-            
+
+        while head < len(queue):
+            current = queue[head]
+            head += 1
+
             if current == goal:
                 break
-            
+
+            next_dist = distance[current] + 1
             for neighbor in graph.get_neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    distance[neighbor] = distance[current] + 1
+                seen = distance.get(neighbor)
+                if seen is None:
+                    distance[neighbor] = next_dist
                     parents[neighbor] = [current]
                     queue.append(neighbor)
-                elif distance[neighbor] == distance[current] + 1:
+                elif seen == next_dist:
                     parents[neighbor].append(current)
-        
-        return distance, parents, visited
+
+        return distance, parents, set(distance)
     
-    def _backtrack_paths(self, node: int, current_path: List[int], all_paths: List[List[int]], 
+    def _backtrack_paths(self, node: int, current_path: List[int], all_paths: List[List[int]],
                         start_node: int, max_paths: int, parents: dict) -> None:
-        """Recursive backtrack to find all paths."""
+        """
+        Iterative DFS over the shortest-path DAG formed by the parent
+        lists. The DAG is acyclic by construction (parents are always
+        one level closer to the source), so no per-path cycle checks
+        are needed, and an explicit stack sidesteps the recursion limit
+        on paths hundreds of hops long. All in-flight branches share
+        one path buffer (append on descent, pop on backtrack); a list
+        is only copied when a complete path is emitted. Parent tables
+        are plain-indexed — every node on the DAG was settled with an
+        entry — so dict and position-indexed (compact) tables both work.
+        """
         if len(all_paths) >= max_paths:
             return
-        
-        if node == start_node:
-            all_paths.append(current_path[::-1])  # Reverse to get start->goal
-            return
-        
-        if node in parents:
-            for parent in parents[node]:
-                if len(all_paths) >= max_paths:
-                    break
-                self._backtrack_paths(parent, current_path + [parent], all_paths, start_node, max_paths, parents)
-    
-    def _stream_backtrack(self, node: int, current_path: List[int], 
+        for path in self._stream_backtrack(node, current_path, start_node, parents):
+            all_paths.append(path)
+            if len(all_paths) >= max_paths:
+                return
+
+    def _stream_backtrack(self, node: int, current_path: List[int],
                          start_node: int, parents: dict) -> Iterator[List[int]]:
-        """Streaming backtrack using generator."""
+        """Streaming DAG enumeration sharing one append/pop path buffer."""
+        path = list(current_path)
         if node == start_node:
-            yield current_path[::-1]
+            yield path[::-1]
             return
-        
-        if node in parents:
-            for parent in parents[node]:
-                yield from self._stream_backtrack(parent, current_path + [parent], start_node, parents)
+        stack = [iter(parents[node])]
+        while stack:
+            parent = next(stack[-1], None)
+            if parent is None:  # branch exhausted: backtrack
+                stack.pop()
+                path.pop()
+                continue
+            path.append(parent)
+            if parent == start_node:
+                yield path[::-1]  # snapshot, reversed to start->goal
+                path.pop()
+            else:
+                stack.append(iter(parents[parent]))
     
     def _validate_path(self, path: List[int], graph: GraphInterface, 
                       constraints: Optional[List[ConstraintInterface]]) -> bool:
@@ -24,10 +24,14 @@ class AStarController:
         """
         self.domain_adapter = domain_adapter
         self.astar_algorithm = AStarAlgorithm(
-            self.domain_adapter.message_handler, 
+            self.domain_adapter.message_handler,
             max_paths=5
         )
-    
+
+    def set_csr(self, csr_graph) -> None:
+        """Hand a prebuilt CSR adjacency to the domain adapter."""
+        self.domain_adapter.set_csr(csr_graph)
+
     def find_optimal_paths(self, start_location: str, goal_location: str, 
                           algorithm: str = "astar", max_time: Optional[float] = None) -> Dict[str, Any]:
         """
@@ -30,10 +30,14 @@ class ClassicDFSController:
         
         # Classic DFS algorithm (based on user's implementation)
         self.classic_dfs = ClassicDFSAlgorithm(
-            self.domain_adapter.message_handler, 
+            self.domain_adapter.message_handler,
             max_paths=5
         )
-    
+
+    def set_csr(self, csr_graph) -> None:
+        """Hand a prebuilt CSR adjacency to the domain adapter."""
+        self.domain_adapter.set_csr(csr_graph)
+
     def find_paths_with_constraints(self, start_location: str, goal_location: str,
                                    max_paths: int = 5,
                                    max_depth: Optional[int] = None,
@@ -5,6 +5,7 @@ Works with any domain through adapters and generic components.
 
 from typing import List, Dict, Any, Optional
 
+from config.settings import AVERAGE_SPEED_KMH
 from core.addis_ababa_adapter import AddisAbabaAdapter
 from services.generic_pathfinding_service import GenericPathfindingService
 from services.visualization_service import VisualizationService
@@ -22,7 +23,11 @@ class GenericPathfindingController:
         """
         self.domain_adapter = domain_adapter or AddisAbabaAdapter()
         self.visualization_service = None  # Will be created when needed
-    
+
+    def set_csr(self, csr_graph) -> None:
+        """Hand a prebuilt CSR adjacency to the domain adapter."""
+        self.domain_adapter.set_csr(csr_graph)
+
     def find_optimal_paths(
         self,
         start_location: str,
@@ -59,18 +64,42 @@ class GenericPathfindingController:
                 "paths": []
             }
         
-        # Create pathfinding service with specified algorithm
-        pathfinding_service = self.domain_adapter.create_pathfinding_service(algorithm)
-        
-        # Create domain-specific constraints
-        constraints = self.domain_adapter.create_addis_constraints(
-            max_nodes=max_nodes,
-            max_distance=max_distance,
-            max_time=max_time,
+        # Single-path fast mode: when exactly one path is wanted, or
+        # the query carries a node/distance/time budget, and a CSR
+        # snapshot is installed, the compiled kernel in
+        # CSRGraph.shortest_path answers directly, enforcing the
+        # budgets inside the search instead of post-checking them on a
+        # finished path. Budgeted queries trade alternative paths for
+        # in-search pruning.
+        csr = self.domain_adapter.csr_graph
+        budgeted = (
+            max_nodes is not None
+            or max_distance is not None
+            or max_time is not None
         )
-        
-        # Find paths
-        results = pathfinding_service.find_paths(start_node, goal_node, constraints, max_paths)
+        if (
+            algorithm.lower() == "bfs"
+            and (max_paths == 1 or budgeted)
+            and csr is not None
+            and start_node in csr.node_to_idx
+            and goal_node in csr.node_to_idx
+        ):
+            results = self._find_single_path_csr(
+                start_node, goal_node, max_nodes, max_distance, max_time
+            )
+        else:
+            # Create pathfinding service with specified algorithm
+            pathfinding_service = self.domain_adapter.create_pathfinding_service(algorithm)
+
+            # Create domain-specific constraints
+            constraints = self.domain_adapter.create_addis_constraints(
+                max_nodes=max_nodes,
+                max_distance=max_distance,
+                max_time=max_time,
+            )
+
+            # Find paths
+            results = pathfinding_service.find_paths(start_node, goal_node, constraints, max_paths)
         
         # Add domain-specific information
         if results["success"]:
@@ -87,7 +116,64 @@ class GenericPathfindingController:
         
         return results
     
-    def visualize_paths(self, path_results: Dict[str, Any], 
+    def _find_single_path_csr(
+        self,
+        start_node: int,
+        goal_node: int,
+        max_nodes: Optional[int] = None,
+        max_distance: Optional[float] = None,
+        max_time: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Single-path BFS through the compiled CSR kernel.
+
+        Returns the same result shape as the generic service so the
+        callers (display, visualization) need no special casing. The
+        kernel does not track an explored set, so visited_nodes comes
+        back empty. A time budget converts to a distance budget at the
+        average network speed — the same model TimeConstraint uses —
+        so it prunes during the search too.
+        """
+        message_handler = self.domain_adapter.message_handler
+
+        if start_node == goal_node:
+            message = "Start and goal are the same location"
+            if message_handler:
+                message_handler.handle_error(message)
+            return {"success": False, "message": message, "paths": []}
+
+        limit_dist = max_distance
+        if max_time:
+            speed_m_per_s = (AVERAGE_SPEED_KMH * 1000.0) / 3600.0
+            time_dist = max_time * speed_m_per_s
+            limit_dist = time_dist if limit_dist is None else min(limit_dist, time_dist)
+
+        path = self.domain_adapter.csr_graph.shortest_path(
+            start_node, goal_node,
+            max_nodes=max_nodes, max_distance=limit_dist,
+        )
+        if not path:
+            message = "No paths found between the specified nodes"
+            if message_handler:
+                message_handler.handle_info(message)
+            return {"success": False, "message": message, "paths": []}
+
+        statistics = self.domain_adapter.path_calculator.get_path_statistics(
+            [path], self.domain_adapter.graph_adapter
+        )
+        if message_handler:
+            message_handler.handle_success("Found 1 paths using BFSAlgorithm")
+        return {
+            "success": True,
+            "paths": [path],
+            "primary_path": path,
+            "all_paths": [path],
+            "visited_nodes": set(),
+            "statistics": statistics,
+            "algorithm": "BFSAlgorithm",
+        }
+
+    def visualize_paths(self, path_results: Dict[str, Any],
                        save_path: str = "path_visualization.png", 
                        show_plot: bool = True) -> None:
         """
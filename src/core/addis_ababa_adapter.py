@@ -7,6 +7,7 @@ import osmnx as ox
 from typing import List, Dict, Any, Optional, Tuple, Union
 
 from core.graph_interface import MessageHandlerInterface
+from core.csr_graph import COORD_SCALE
 from core.networkx_graph_adapter import NetworkXGraphAdapter
 from core.graph_model import GraphModel
 from core.location_model import LocationModel
@@ -53,7 +54,17 @@ class AddisAbabaAdapter:
         self.bfs_algorithm = BFSAlgorithm(self.message_handler)
         self.dfs_algorithm = DFSAlgorithm(self.message_handler)
         self.astar_algorithm = AStarAlgorithm(self._euclidean_heuristic, self.message_handler)
-    
+
+        # Optional CSR adjacency, installed via set_csr once the static
+        # graph is loaded; algorithms can use it for flat-array traversal.
+        self.csr_graph = None
+
+    def set_csr(self, csr_graph) -> None:
+        """Install a prebuilt CSR adjacency for flat-array traversal."""
+        self.csr_graph = csr_graph
+        self.graph_adapter.csr_graph = csr_graph
+        self.path_calculator.set_csr(csr_graph)
+
     def create_pathfinding_service(self, algorithm_name: str = "bfs") -> GenericPathfindingService:
         """
         Create a pathfinding service with the specified algorithm.
@@ -120,12 +131,24 @@ class AddisAbabaAdapter:
     
     def _euclidean_heuristic(self, node: int, goal: int, graph) -> float:
         """Euclidean distance heuristic for A*."""
+        csr = self.csr_graph
+        if csr is not None:
+            # Indexed reads from the CSR coordinate columns; the dict
+            # path below materializes two attribute dicts per expanded
+            # node, which adds up across an A* search.
+            i = csr.node_to_idx.get(node)
+            j = csr.node_to_idx.get(goal)
+            if i is not None and j is not None:
+                dlat = float(csr.lat_q[i] - csr.lat_q[j]) / COORD_SCALE
+                dlon = float(csr.lon_q[i] - csr.lon_q[j]) / COORD_SCALE
+                return (dlat * dlat + dlon * dlon) ** 0.5 * 111000
+
         node_data = graph.get_node_data(node)
         goal_data = graph.get_node_data(goal)
-        
+
         lat1, lon1 = node_data['y'], node_data['x']
         lat2, lon2 = goal_data['y'], goal_data['x']
-        
+
         # Simple Euclidean distance approximation
         return ((lat2 - lat1) ** 2 + (lon2 - lon1) ** 2) ** 0.5 * 111000  # Convert to meters
     
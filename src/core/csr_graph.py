@@ -0,0 +1,523 @@
+"""
+CSR (compressed sparse row) adjacency for the road network.
+Single responsibility: flat-array graph representation for fast traversal.
+
+NetworkX stores adjacency as nested Python dicts, which makes every
+neighbor visit a hash lookup plus object dereference. Converting the
+static road graph once into three flat NumPy arrays (indptr, indices,
+weights) lets traversal kernels stream neighbors from contiguous memory,
+and gives Numba-compiled algorithms something they can actually compile.
+"""
+
+import numpy as np
+import networkx as nx
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # numba is an optional accelerator
+    HAS_NUMBA = False
+
+# Below this many nodes the per-level thread fork/join of the parallel
+# BFS kernel costs more than it saves; stay on the serial kernel.
+PARALLEL_MIN_NODES = 10_000
+
+# Direction-optimization threshold (Beamer's alpha): go bottom-up once
+# the frontier's out-edges exceed 1/alpha of the edges still incident
+# to unvisited nodes.
+BFS_ALPHA = 14
+
+# Fixed-point scale for node coordinates: microdegrees fit the whole
+# lat/lon range in int32 with ~0.1 m resolution, halving the footprint
+# of float64 and keeping coordinate math SIMD-friendly.
+COORD_SCALE = 1_000_000
+
+EARTH_RADIUS_M = 6_371_000.0
+
+# Microdegrees -> radians, folded into one multiplier.
+_Q_TO_RAD = np.pi / (180.0 * COORD_SCALE)
+
+
+class CSRGraph:
+    """Immutable CSR adjacency built once from a NetworkX graph."""
+
+    def __init__(self, node_ids: List[int], node_to_idx: Dict[int, int],
+                 indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                 lat_q: np.ndarray = None, lon_q: np.ndarray = None):
+        """
+        Initialize with prebuilt CSR arrays.
+
+        Args:
+            node_ids: Original node id for each CSR index
+            node_to_idx: Original node id -> CSR index
+            indptr: Row pointers (len = n_nodes + 1), int32
+            indices: Column indices (neighbor CSR indices), int32
+            weights: Edge lengths in meters, float32
+            lat_q: Node latitudes in microdegrees, int32 (optional)
+            lon_q: Node longitudes in microdegrees, int32 (optional)
+        """
+        self.node_ids = node_ids
+        self.node_to_idx = node_to_idx
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.lat_q = lat_q
+        self.lon_q = lon_q
+        # Sorted edge-key table for vectorized length lookups; built on
+        # first use by _ensure_edge_index.
+        self._edge_keys = None
+        self._edge_key_weights = None
+        # Source node -> level array memo: reachability prechecks hit
+        # the same source repeatedly, so each sweep is paid once.
+        self._levels_cache: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph) -> "CSRGraph":
+        """
+        Flatten a NetworkX graph into CSR arrays.
+
+        Directed graphs are symmetrized on the fly — each row holds the
+        union of out- and in-neighbors — so callers never need the
+        doubled-memory graph.to_undirected() copy. Multi-edges collapse
+        to their shortest length; nodes keep the iteration order of the
+        source graph.
+        """
+        node_ids = list(graph.nodes())
+        node_to_idx = {node: i for i, node in enumerate(node_ids)}
+        n = len(node_ids)
+        directed = graph.is_directed()
+
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        neighbor_idx: List[int] = []
+        neighbor_len: List[float] = []
+
+        for i, node in enumerate(node_ids):
+            # Deduplicate multi-edges, keeping the shortest length.
+            best: Dict[int, float] = {}
+            neighbors = graph.neighbors(node)
+            if directed:
+                neighbors = chain(neighbors, graph.predecessors(node))
+            for neighbor in neighbors:
+                datas = [graph.get_edge_data(node, neighbor)]
+                if directed:
+                    # A two-way street is two directed edges; keep the
+                    # shorter, as the undirected copy would have.
+                    datas.append(graph.get_edge_data(neighbor, node))
+                length = None
+                for data in datas:
+                    if not data:
+                        continue
+                    if 0 in data:  # MultiGraph: keyed parallel edges
+                        found = min(
+                            d.get("length", 1.0) for d in data.values()
+                        )
+                    else:
+                        found = data.get("length", 1.0)
+                    if length is None or found < length:
+                        length = found
+                if length is None:
+                    length = 1.0
+                j = node_to_idx[neighbor]
+                if j not in best or length < best[j]:
+                    best[j] = length
+            for j, length in best.items():
+                neighbor_idx.append(j)
+                neighbor_len.append(length)
+            indptr[i + 1] = len(neighbor_idx)
+
+        # Quantize node coordinates to fixed-point microdegrees so the
+        # whole coordinate table is two dense int32 columns.
+        nodes = graph.nodes
+        lat_q = np.round(np.fromiter(
+            (nodes[node].get("y", 0.0) for node in node_ids),
+            dtype=np.float64, count=n,
+        ) * COORD_SCALE).astype(np.int32)
+        lon_q = np.round(np.fromiter(
+            (nodes[node].get("x", 0.0) for node in node_ids),
+            dtype=np.float64, count=n,
+        ) * COORD_SCALE).astype(np.int32)
+
+        return cls(
+            node_ids=node_ids,
+            node_to_idx=node_to_idx,
+            indptr=indptr,
+            indices=np.asarray(neighbor_idx, dtype=np.int32),
+            weights=np.asarray(neighbor_len, dtype=np.float32),
+            lat_q=lat_q,
+            lon_q=lon_q,
+        )
+
+    # Arrays persisted by the disk cache, one .npy file each so they
+    # can be memory-mapped individually on reload.
+    _CACHE_ARRAYS = ("indptr", "indices", "weights", "lat_q", "lon_q")
+
+    @classmethod
+    def load_or_build(cls, graph: nx.Graph, cache_dir: Path) -> "CSRGraph":
+        """
+        Load the CSR arrays from a cache directory, or build and save.
+
+        Cached arrays come back through np.load(..., mmap_mode='r'), so
+        a warm start only page-faults in the rows a traversal actually
+        touches and concurrent processes share one resident copy. The
+        cache is only trusted if its node count matches the graph; a
+        stale directory (e.g. after a fresh map download) is rebuilt.
+        """
+        cache_dir = Path(cache_dir)
+        ids_file = cache_dir / "node_ids.npy"
+        if ids_file.exists():
+            try:
+                cached_ids = np.load(ids_file)
+                if cached_ids.shape[0] == graph.number_of_nodes():
+                    node_ids = [int(nid) for nid in cached_ids]
+                    arrays = {
+                        name: np.load(cache_dir / f"{name}.npy", mmap_mode="r")
+                        for name in cls._CACHE_ARRAYS
+                    }
+                    return cls(
+                        node_ids=node_ids,
+                        node_to_idx={nid: i for i, nid in enumerate(node_ids)},
+                        **arrays,
+                    )
+            except Exception:
+                pass  # unreadable/stale cache: fall through and rebuild
+        csr = cls.from_networkx(graph)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            np.save(ids_file, np.asarray(csr.node_ids, dtype=np.int64))
+            for name in cls._CACHE_ARRAYS:
+                np.save(cache_dir / f"{name}.npy", getattr(csr, name))
+        except OSError:
+            pass  # caching is best-effort; the in-memory CSR still works
+        return csr
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the graph."""
+        return len(self.node_ids)
+
+    def coords_float(self) -> tuple:
+        """Dequantized (lats, lons) float64 views for plotting/geometry."""
+        return (
+            self.lat_q.astype(np.float64) / COORD_SCALE,
+            self.lon_q.astype(np.float64) / COORD_SCALE,
+        )
+
+    def _ensure_edge_index(self) -> None:
+        """Build the sorted (row * n + neighbor) key table once."""
+        if self._edge_keys is None:
+            n = self.num_nodes
+            rows = np.repeat(
+                np.arange(n, dtype=np.int64), np.diff(self.indptr)
+            )
+            keys = rows * n + self.indices.astype(np.int64)
+            order = np.argsort(keys)
+            self._edge_keys = keys[order]
+            self._edge_key_weights = self.weights[order]
+
+    def path_distance(self, path: List[int]) -> float:
+        """
+        Summed edge length in meters along a path of node ids.
+
+        One vectorized searchsorted over the packed (u, v) edge keys
+        replaces a per-edge get_edge_data/dict-probe loop. Consecutive
+        pairs that are not edges contribute nothing; unknown node ids
+        raise KeyError like any node_to_idx miss.
+        """
+        if len(path) < 2:
+            return 0.0
+        self._ensure_edge_index()
+        n = self.num_nodes
+        idx = np.fromiter(
+            (self.node_to_idx[node] for node in path),
+            dtype=np.int64, count=len(path),
+        )
+        query = idx[:-1] * n + idx[1:]
+        pos = np.searchsorted(self._edge_keys, query)
+        pos = np.minimum(pos, self._edge_keys.shape[0] - 1)
+        found = self._edge_keys[pos] == query
+        return float(self._edge_key_weights[pos[found]].sum(dtype=np.float64))
+
+    def bfs_levels(self, start_node: int) -> np.ndarray:
+        """
+        BFS level (hop count) from start_node to every node.
+
+        Returns an int32 array indexed by CSR index; unreachable nodes
+        hold -1. Uses the Numba kernel when available, and the
+        level-synchronous parallel kernel for graphs large enough that
+        its per-level fork/join pays off. Results are memoized per
+        source, so repeated queries from the same start are one lookup.
+        """
+        levels = self._levels_cache.get(start_node)
+        if levels is not None:
+            return levels
+        start = self.node_to_idx[start_node]
+        if HAS_NUMBA:
+            if self.num_nodes >= PARALLEL_MIN_NODES:
+                levels = _bfs_levels_parallel_csr(self.indptr, self.indices, start)
+            else:
+                levels = _bfs_levels_csr(self.indptr, self.indices, start)
+        else:
+            levels = _bfs_levels_python(self.indptr, self.indices, start)
+        if len(self._levels_cache) > 8:
+            self._levels_cache.clear()
+        self._levels_cache[start_node] = levels
+        return levels
+
+    def shortest_path(self, start_node: int, goal_node: int,
+                      max_nodes: int = None,
+                      max_distance: float = None) -> List[int]:
+        """
+        BFS shortest path (fewest hops) between two node ids.
+
+        Returns the path as original node ids, or [] when the goal is
+        unreachable or a constraint cut the search off. max_nodes
+        bounds how many nodes may be dequeued; max_distance bounds the
+        summed edge length (meters) along the tree path, and also
+        prunes nodes whose travelled distance plus the great-circle
+        remainder to the goal already exceeds the budget.
+        """
+        src = self.node_to_idx[start_node]
+        dst = self.node_to_idx[goal_node]
+        if src == dst:
+            return [start_node]
+        limit_nodes = -1 if max_nodes is None else int(max_nodes)
+        limit_dist = -1.0 if max_distance is None else float(max_distance)
+        if self.lat_q is not None:
+            lat_q, lon_q = self.lat_q, self.lon_q
+        else:  # no coordinates: zero bound degrades to the plain check
+            lat_q = lon_q = np.zeros(self.num_nodes, dtype=np.int32)
+        if HAS_NUMBA:
+            parent = _bfs_parents_csr(self.indptr, self.indices, self.weights,
+                                      lat_q, lon_q,
+                                      src, dst, limit_nodes, limit_dist)
+        else:
+            parent = _bfs_parents_python(self.indptr, self.indices, self.weights,
+                                         lat_q, lon_q,
+                                         src, dst, limit_nodes, limit_dist)
+        if parent[dst] < 0:
+            return []
+        # Walk the parent chain back to the source.
+        if HAS_NUMBA:
+            chain_idx = _walk_parents(parent, src, dst)
+        else:
+            path = [dst]
+            while path[-1] != src:
+                path.append(int(parent[path[-1]]))
+            chain_idx = reversed(path)
+        return [self.node_ids[i] for i in chain_idx]
+
+
+def _bfs_levels_python(indptr: np.ndarray, indices: np.ndarray, start: int) -> np.ndarray:
+    """Pure-Python BFS over the CSR arrays (fallback when Numba is absent)."""
+    n = indptr.shape[0] - 1
+    levels = np.full(n, -1, dtype=np.int32)
+    levels[start] = 0
+    queue = [start]
+    while queue:
+        next_queue = []
+        for u in queue:
+            for ei in range(indptr[u], indptr[u + 1]):
+                v = indices[ei]
+                if levels[v] < 0:
+                    levels[v] = levels[u] + 1
+                    next_queue.append(v)
+        queue = next_queue
+    return levels
+
+
+def _bfs_parents_python(indptr, indices, weights, lat_q, lon_q, src, dst,
+                        limit_nodes, limit_dist):
+    """Pure-Python constrained BFS; mirrors the Numba kernel below."""
+    n = indptr.shape[0] - 1
+    parent = np.full(n, -1, dtype=np.int32)
+    dist = np.zeros(n, dtype=np.float64)
+    parent[src] = src
+    queue = [src]
+    popped = 0
+    goal_lat = lat_q[dst] * _Q_TO_RAD
+    goal_lon = lon_q[dst] * _Q_TO_RAD
+    cos_goal = np.cos(goal_lat)
+    for u in queue:
+        popped += 1
+        if limit_nodes >= 0 and popped > limit_nodes:
+            break
+        for ei in range(indptr[u], indptr[u + 1]):
+            v = indices[ei]
+            if parent[v] >= 0:
+                continue
+            nd = dist[u] + weights[ei]
+            if limit_dist >= 0.0:
+                vlat = lat_q[v] * _Q_TO_RAD
+                vlon = lon_q[v] * _Q_TO_RAD
+                sdlat = np.sin((vlat - goal_lat) * 0.5)
+                sdlon = np.sin((vlon - goal_lon) * 0.5)
+                a = sdlat * sdlat + np.cos(vlat) * cos_goal * sdlon * sdlon
+                remaining = 2.0 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+                if nd + remaining > limit_dist:
+                    continue
+            parent[v] = u
+            dist[v] = nd
+            if v == dst:
+                return parent
+            queue.append(v)
+    return parent
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _bfs_parents_csr(indptr, indices, weights, lat_q, lon_q, src, dst,
+                         limit_nodes, limit_dist):
+        """
+        Constrained BFS tree over CSR arrays; parent[dst] < 0 = no path.
+
+        When a distance budget is set, each push is bounded by the
+        distance travelled so far plus the great-circle remainder to
+        the goal — an admissible lower bound, so only nodes that cannot
+        possibly finish within budget are pruned, but for tight budgets
+        the search collapses to a corridor around the goal line.
+        """
+        n = indptr.shape[0] - 1
+        parent = np.full(n, -1, dtype=np.int32)
+        dist = np.zeros(n, dtype=np.float64)
+        queue = np.empty(n, dtype=np.int32)
+        goal_lat = lat_q[dst] * _Q_TO_RAD
+        goal_lon = lon_q[dst] * _Q_TO_RAD
+        cos_goal = np.cos(goal_lat)
+        # Visited nodes packed 64 to a uint64 word: the membership probe
+        # is the hottest load in the loop, and the bitset is 32x smaller
+        # than the parent column, so far more of it stays in L1/L2.
+        visited_bits = np.zeros((n + 63) >> 6, dtype=np.uint64)
+        one = np.uint64(1)
+        visited_bits[src >> 6] |= one << np.uint64(src & 63)
+        parent[src] = src
+        queue[0] = src
+        head = 0
+        tail = 1
+        popped = 0
+        while head < tail:
+            u = queue[head]
+            head += 1
+            popped += 1
+            if limit_nodes >= 0 and popped > limit_nodes:
+                break
+            for ei in range(indptr[u], indptr[u + 1]):
+                v = indices[ei]
+                word = v >> 6
+                bit = one << np.uint64(v & 63)
+                if visited_bits[word] & bit:
+                    continue
+                nd = dist[u] + weights[ei]
+                if limit_dist >= 0.0:
+                    vlat = lat_q[v] * _Q_TO_RAD
+                    vlon = lon_q[v] * _Q_TO_RAD
+                    sdlat = np.sin((vlat - goal_lat) * 0.5)
+                    sdlon = np.sin((vlon - goal_lon) * 0.5)
+                    a = sdlat * sdlat + np.cos(vlat) * cos_goal * sdlon * sdlon
+                    remaining = 2.0 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+                    if nd + remaining > limit_dist:
+                        continue
+                visited_bits[word] |= bit
+                parent[v] = u
+                dist[v] = nd
+                if v == dst:
+                    return parent
+                queue[tail] = v
+                tail += 1
+        return parent
+
+    @njit(cache=True)
+    def _walk_parents(parent, src, dst):
+        """Follow the parent chain dst -> src into one src-first array."""
+        buf = np.empty(parent.shape[0], dtype=np.int32)
+        count = 0
+        v = dst
+        while True:
+            buf[count] = v
+            count += 1
+            if v == src:
+                break
+            v = parent[v]
+        return buf[:count][::-1]
+
+    @njit(cache=True)
+    def _bfs_levels_csr(indptr, indices, start):
+        """Numba BFS over CSR arrays using a preallocated ring of nodes."""
+        n = indptr.shape[0] - 1
+        levels = np.full(n, -1, dtype=np.int32)
+        queue = np.empty(n, dtype=np.int32)
+        # Same packed-bitset membership probe as the parents kernel.
+        visited_bits = np.zeros((n + 63) >> 6, dtype=np.uint64)
+        one = np.uint64(1)
+        visited_bits[start >> 6] |= one << np.uint64(start & 63)
+        levels[start] = 0
+        queue[0] = start
+        head = 0
+        tail = 1
+        while head < tail:
+            u = queue[head]
+            head += 1
+            for ei in range(indptr[u], indptr[u + 1]):
+                v = indices[ei]
+                word = v >> 6
+                bit = one << np.uint64(v & 63)
+                if visited_bits[word] & bit == 0:
+                    visited_bits[word] |= bit
+                    levels[v] = levels[u] + 1
+                    queue[tail] = v
+                    tail += 1
+        return levels
+
+    @njit(parallel=True, cache=True)
+    def _bfs_levels_parallel_csr(indptr, indices, start):
+        """
+        Level-synchronous parallel BFS, direction-optimized: threads
+        split the frontier and mark next-level candidates in a byte
+        mask (racy writes are idempotent, so no atomics are needed).
+        When the frontier's out-edges outgrow 1/alpha of the edges
+        still touching unvisited nodes, the level flips to bottom-up
+        "pull" — each unvisited node scans its own row for a frontier
+        neighbor and stops at the first hit, skipping the bulk of the
+        already-visited edge examinations. Levels are assigned in a
+        short sequential sweep per level, keeping results deterministic.
+        """
+        n = indptr.shape[0] - 1
+        levels = np.full(n, -1, dtype=np.int32)
+        levels[start] = 0
+        frontier = np.empty(1, dtype=np.int32)
+        frontier[0] = start
+        level = 0
+        mf = indptr[start + 1] - indptr[start]  # frontier out-edges
+        mu = indices.shape[0] - mf              # edges on unvisited nodes
+        while frontier.shape[0] > 0:
+            next_mask = np.zeros(n, dtype=np.uint8)
+            if mf * BFS_ALPHA > mu:
+                # Bottom-up: unvisited nodes pull from the frontier.
+                for v in prange(n):
+                    if levels[v] < 0:
+                        for ei in range(indptr[v], indptr[v + 1]):
+                            if levels[indices[ei]] == level:
+                                next_mask[v] = 1
+                                break
+            else:
+                # Top-down: frontier pushes to unvisited neighbors.
+                for i in prange(frontier.shape[0]):
+                    u = frontier[i]
+                    for ei in range(indptr[u], indptr[u + 1]):
+                        v = indices[ei]
+                        if levels[v] < 0:
+                            next_mask[v] = 1
+            next_frontier = np.nonzero(next_mask)[0].astype(np.int32)
+            level += 1
+            mf = 0
+            for i in range(next_frontier.shape[0]):
+                v = next_frontier[i]
+                levels[v] = level
+                mf += indptr[v + 1] - indptr[v]
+            mu -= mf
+            frontier = next_frontier
+        return levels
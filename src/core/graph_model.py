@@ -5,6 +5,7 @@ Single responsibility: Graph data management and basic operations.
 
 import osmnx as ox
 import networkx as nx
+from itertools import chain
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -39,8 +40,11 @@ class GraphModel:
             ox.save_graphml(self._graph, GRAPH_CACHE_FILE)
             print("Map data saved to cache")
         
-        # Convert to undirected for comprehensive path finding
-        self._graph = self._graph.to_undirected()
+        # The graph stays directed as loaded: to_undirected() deep-copies
+        # every edge-attribute dict just to double the edges, roughly
+        # doubling peak RAM. Accessors below treat directed edges
+        # symmetrically instead, which gives path finding the same
+        # undirected view for free.
     
     @property
     def graph(self) -> nx.Graph:
@@ -52,23 +56,31 @@ class GraphModel:
         return self._graph.nodes[node_id]
     
     def get_edge_data(self, u: int, v: int) -> Optional[Dict[str, Any]]:
-        """Get edge data between two nodes."""
+        """Get edge data between two nodes (either direction)."""
         try:
-            return self._graph.get_edge_data(u, v)
+            data = self._graph.get_edge_data(u, v)
+            if data is None and self._graph.is_directed():
+                data = self._graph.get_edge_data(v, u)
+            return data
         except:
             return None
-    
+
     def get_neighbors(self, node_id: int) -> list:
-        """Get neighbors of a node."""
+        """Get neighbors of a node, ignoring edge direction."""
+        if self._graph.is_directed():
+            return list(dict.fromkeys(chain(
+                self._graph.successors(node_id),
+                self._graph.predecessors(node_id),
+            )))
         return list(self._graph.neighbors(node_id))
-    
+
     def node_exists(self, node_id: int) -> bool:
         """Check if a node exists in the graph."""
         return node_id in self._graph.nodes
-    
+
     def edge_exists(self, u: int, v: int) -> bool:
-        """Check if an edge exists between two nodes."""
-        return self._graph.has_edge(u, v)
+        """Check if an edge exists between two nodes (either direction)."""
+        return self._graph.has_edge(u, v) or self._graph.has_edge(v, u)
     
     def get_subgraph(self, nodes: list) -> nx.Graph:
         """Get a subgraph containing only the specified nodes."""
@@ -4,29 +4,146 @@ Single responsibility: Location data management and node lookup.
 """
 
 import osmnx as ox
+import numpy as np
 from typing import Union, Tuple, Optional
 
+try:
+    from scipy.spatial import cKDTree
+
+    HAS_SCIPY = True
+except ImportError:  # scipy is an optional accelerator
+    HAS_SCIPY = False
+
 from config.settings import LOCATIONS
 
+# Quantization step for Morton codes (~1 m) and the starting search
+# radius for z-order queries (~500 m), widened until a hit is found.
+_Z_QUANT = 1e5
+_Z_SEED_RADIUS_DEG = 0.005
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Spread the low 32 bits of each uint64 over the even positions."""
+    v = (v | (v << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x3333333333333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x5555555555555555)
+    return v
+
+
+def _morton_codes(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Interleave quantized (lat, lon) into z-order codes."""
+    qlat = np.clip((lat + 90.0) * _Z_QUANT, 0, None).astype(np.uint64)
+    qlon = np.clip((lon + 180.0) * _Z_QUANT, 0, None).astype(np.uint64)
+    return (_spread_bits(qlat) << np.uint64(1)) | _spread_bits(qlon)
+
 
 class LocationModel:
     """Manages location data and provides node lookup functionality."""
-    
+
     def __init__(self, graph):
         """Initialize with the road network graph."""
         self.graph = graph
         self.locations = LOCATIONS
-    
+        # One spatial index over all node coordinates, built once;
+        # every ox.distance.nearest_nodes call would otherwise rebuild
+        # its index over the whole graph per lookup. A cKDTree when
+        # scipy is present, otherwise a z-order (Morton) sorted array
+        # answered with binary search + a pruned vectorized scan.
+        self._kdtree = None
+        self._kdtree_node_ids = None
+        self._z_vals = None
+        self._z_lat = None
+        self._z_lon = None
+        self._z_node_ids = None
+        self._nearest_cache = {}
+        # Normalized name -> coordinates; unknown names fall through to
+        # ox.geocode, a network round-trip worth paying at most once.
+        self._name_cache = {}
+        if HAS_SCIPY:
+            self._build_kdtree()
+        else:
+            self._build_zindex()
+        # Named locations are the common queries; resolve them up
+        # front so the first pathfinding click pays nothing.
+        if self._kdtree is not None or self._z_vals is not None:
+            for point in self.locations.values():
+                self.get_nearest_node(point)
+
+    def _build_kdtree(self) -> None:
+        """Index node (x, y) coordinates for nearest-node queries."""
+        node_ids = []
+        xy = []
+        for node_id, data in self.graph.nodes(data=True):
+            node_ids.append(node_id)
+            xy.append((data.get("x", 0.0), data.get("y", 0.0)))
+        if xy:
+            self._kdtree = cKDTree(np.asarray(xy, dtype=np.float64))
+            self._kdtree_node_ids = node_ids
+
+    def _build_zindex(self) -> None:
+        """Sort node coordinates by Morton code for pruned lookups."""
+        node_ids = []
+        lats = []
+        lons = []
+        for node_id, data in self.graph.nodes(data=True):
+            node_ids.append(node_id)
+            lats.append(data.get("y", 0.0))
+            lons.append(data.get("x", 0.0))
+        if not node_ids:
+            return
+        lat = np.asarray(lats, dtype=np.float64)
+        lon = np.asarray(lons, dtype=np.float64)
+        order = np.argsort(_morton_codes(lat, lon))
+        self._z_vals = _morton_codes(lat, lon)[order]
+        self._z_lat = lat[order]
+        self._z_lon = lon[order]
+        self._z_node_ids = [node_ids[i] for i in order]
+
+    def _query_zindex(self, lat: float, lon: float) -> int:
+        """
+        Nearest node via the z-order index: z-codes inside a bbox lie
+        between the codes of its corners, so two binary searches prune
+        the candidate slice, then a vectorized argmin settles it. The
+        bbox is widened until the winner is safely inside it.
+        """
+        n = len(self._z_node_ids)
+        radius = _Z_SEED_RADIUS_DEG
+        while True:
+            zlo = _morton_codes(
+                np.array([lat - radius]), np.array([lon - radius])
+            )[0]
+            zhi = _morton_codes(
+                np.array([lat + radius]), np.array([lon + radius])
+            )[0]
+            lo = int(np.searchsorted(self._z_vals, zlo))
+            hi = int(np.searchsorted(self._z_vals, zhi, side="right"))
+            if hi > lo:
+                dlat = self._z_lat[lo:hi] - lat
+                dlon = self._z_lon[lo:hi] - lon
+                sq = dlat * dlat + dlon * dlon
+                best = lo + int(sq.argmin())
+                if float(sq.min()) ** 0.5 <= radius or hi - lo == n:
+                    return self._z_node_ids[best]
+            if lo == 0 and hi == n:
+                break
+            radius *= 4
+        # Degenerate case: fall back to a full vectorized scan.
+        dlat = self._z_lat - lat
+        dlon = self._z_lon - lon
+        return self._z_node_ids[int((dlat * dlat + dlon * dlon).argmin())]
+
     def get_nearest_node(self, location: Union[str, Tuple[float, float]]) -> int:
         """
         Get the nearest node to a location.
-        
+
         Args:
             location: Location name (str) or coordinates (lat, lon)
-            
+
         Returns:
             Node ID nearest to the location
-            
+
         Raises:
             ValueError: If location cannot be found
         """
@@ -34,8 +151,21 @@ class LocationModel:
             point = self._resolve_location_name(location)
         else:
             point = location
-            
-        return ox.distance.nearest_nodes(self.graph, point[1], point[0])
+
+        # Round to ~0.1 m so float noise in repeated coordinates still
+        # hits the memo.
+        point = (round(float(point[0]), 6), round(float(point[1]), 6))
+        node_id = self._nearest_cache.get(point)
+        if node_id is None:
+            if self._kdtree is not None:
+                _, idx = self._kdtree.query((point[1], point[0]))
+                node_id = self._kdtree_node_ids[int(idx)]
+            elif self._z_vals is not None:
+                node_id = self._query_zindex(point[0], point[1])
+            else:
+                node_id = ox.distance.nearest_nodes(self.graph, point[1], point[0])
+            self._nearest_cache[point] = node_id
+        return node_id
     
     def _resolve_location_name(self, location_name: str) -> Tuple[float, float]:
         """
@@ -52,22 +182,30 @@ class LocationModel:
         """
         # Normalize location name for case-insensitive matching
         normalized_input = location_name.strip().lower()
-        
+
+        cached = self._name_cache.get(normalized_input)
+        if cached is not None:
+            return cached
+
         # Check predefined locations with case-insensitive matching
         for stored_name, coordinates in self.locations.items():
             if stored_name.lower() == normalized_input:
+                self._name_cache[normalized_input] = coordinates
                 return coordinates
-        
+
         # Try partial matching for common variations
         for stored_name, coordinates in self.locations.items():
             if normalized_input in stored_name.lower() or stored_name.lower() in normalized_input:
+                self._name_cache[normalized_input] = coordinates
                 return coordinates
-        
+
         # Try to geocode the location name
         try:
-            return ox.geocode(f"{location_name}, Addis Ababa, Ethiopia")
+            coordinates = ox.geocode(f"{location_name}, Addis Ababa, Ethiopia")
         except Exception:
             raise ValueError(f"Location '{location_name}' not found")
+        self._name_cache[normalized_input] = coordinates
+        return coordinates
     
     def get_node_name(self, node_id: int) -> str:
         """
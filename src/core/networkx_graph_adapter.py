@@ -3,38 +3,60 @@ NetworkX graph adapter.
 Adapts NetworkX graphs to the generic GraphInterface.
 """
 
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from typing import List, Dict, Any, Optional, Tuple
 
 from .graph_interface import GraphInterface
 
 
 class NetworkXGraphAdapter(GraphInterface):
     """Adapter for NetworkX graphs to implement GraphInterface."""
-    
+
     def __init__(self, networkx_graph):
         """Initialize with a NetworkX graph."""
         self.graph = networkx_graph
-    
-    def get_neighbors(self, node: int) -> List[int]:
-        """Get neighbors of a node."""
-        return list(self.graph.neighbors(node))
+        # Node -> tuple of neighbors, filled on first visit. The road
+        # graph is static after load, and plain tuple iteration skips
+        # NetworkX's per-call AtlasView wrapping in the BFS hot loop.
+        self._adj_cache: Dict[int, Tuple[int, ...]] = {}
+        # Optional CSR adjacency; algorithms that can traverse flat
+        # arrays pick it up from here.
+        self.csr_graph = None
+
+    def get_neighbors(self, node: int) -> Tuple[int, ...]:
+        """Get neighbors of a node, ignoring edge direction."""
+        neighbors = self._adj_cache.get(node)
+        if neighbors is None:
+            if self.graph.is_directed():
+                # Out- plus in-edges give the undirected neighborhood
+                # without materializing graph.to_undirected().
+                neighbors = tuple(dict.fromkeys(chain(
+                    self.graph.successors(node),
+                    self.graph.predecessors(node),
+                )))
+            else:
+                neighbors = tuple(self.graph.neighbors(node))
+            self._adj_cache[node] = neighbors
+        return neighbors
     
     def node_exists(self, node: int) -> bool:
         """Check if a node exists."""
         return node in self.graph.nodes
     
     def edge_exists(self, u: int, v: int) -> bool:
-        """Check if an edge exists."""
-        return self.graph.has_edge(u, v)
-    
+        """Check if an edge exists (either direction)."""
+        return self.graph.has_edge(u, v) or self.graph.has_edge(v, u)
+
     def get_node_data(self, node: int) -> Dict[str, Any]:
         """Get data for a node."""
         return dict(self.graph.nodes[node])
-    
+
     def get_edge_data(self, u: int, v: int) -> Optional[Dict[str, Any]]:
-        """Get edge data."""
+        """Get edge data (either direction)."""
         try:
             edge_data = self.graph.get_edge_data(u, v)
+            if edge_data is None:
+                edge_data = self.graph.get_edge_data(v, u)
             return dict(edge_data) if edge_data else None
         except:
             return None
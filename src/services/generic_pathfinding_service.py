@@ -58,6 +58,20 @@ class GenericPathfindingService:
                 self.message_handler.handle_error(error_msg)
             return {"success": False, "message": error_msg, "paths": []}
         
+        # Reachability precheck: when the graph carries a CSR, one
+        # cached level sweep from the source rejects unreachable pairs
+        # before the search grows two frontiers over the whole
+        # component, and repeat queries from the same start are free.
+        csr = getattr(self.graph, "csr_graph", None)
+        if csr is not None:
+            goal_idx = csr.node_to_idx.get(goal)
+            if (goal_idx is not None and start in csr.node_to_idx
+                    and csr.bfs_levels(start)[goal_idx] < 0):
+                no_path_msg = "No paths found between the specified nodes"
+                if self.message_handler:
+                    self.message_handler.handle_info(no_path_msg)
+                return {"success": False, "message": no_path_msg, "paths": []}
+
         # Find paths using algorithm
         paths = self.algorithm.find_path(start, goal, self.graph, constraints, max_paths)
         
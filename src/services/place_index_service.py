@@ -17,13 +17,20 @@ import osmnx as ox
 
 from config.settings import CACHE_DIR, DEFAULT_CITY
 
+# Bump when the index format or the tag set below changes; a stale
+# versioned cache is then simply ignored instead of half-parsed.
+INDEX_SCHEMA_VERSION = 2
+
 
 class PlaceIndexService:
     """Manages an index of named places in Addis Ababa for suggestions."""
 
     def __init__(self, city: str = DEFAULT_CITY) -> None:
         self.city = city
-        self.cache_file = Path(CACHE_DIR) / "addis_place_index.json"
+        self.cache_file = (
+            Path(CACHE_DIR) / f"addis_place_index_v{INDEX_SCHEMA_VERSION}.json"
+        )
+        self._legacy_cache_file = Path(CACHE_DIR) / "addis_place_index.json"
         self._names: list[str] = []
         self._ensure_cache_dir()
         self._load_or_build_index()
@@ -63,20 +70,36 @@ class PlaceIndexService:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     def _load_or_build_index(self) -> None:
-        if self.cache_file.exists():
+        # Prefer the versioned cache; fall back to the pre-versioning
+        # file so existing installs skip the Overpass re-download.
+        for cache_file in (self.cache_file, self._legacy_cache_file):
+            if not cache_file.exists():
+                continue
             try:
-                with self.cache_file.open("r", encoding="utf-8") as f:
+                with cache_file.open("r", encoding="utf-8") as f:
                     data = json.load(f)
                 # Ensure it's a list of strings
                 self._names = [str(name) for name in data]
-                if self._names:
-                    return
             except Exception:
                 # Fall back to rebuild if cache is corrupted
-                pass
+                continue
+            if self._names:
+                if cache_file is self._legacy_cache_file:
+                    self._write_cache()  # migrate to the versioned file
+                return
 
         self._build_index()
 
+    def _write_cache(self) -> None:
+        try:
+            with self.cache_file.open("w", encoding="utf-8") as f:
+                # Compact separators: the index is read on every launch,
+                # so keep the file small and cheap to parse.
+                json.dump(self._names, f, ensure_ascii=False, separators=(",", ":"))
+        except Exception:
+            # If caching fails, we still keep _names in memory
+            pass
+
     def _build_index(self) -> None:
         """
         Download and index named geometries for Addis Ababa from OSM.
@@ -108,11 +131,6 @@ class PlaceIndexService:
         # Store sorted for nicer UX
         self._names = sorted(unique_names)
 
-        try:
-            with self.cache_file.open("w", encoding="utf-8") as f:
-                json.dump(self._names, f, ensure_ascii=False, indent=2)
-        except Exception:
-            # If caching fails, we still keep _names in memory
-            pass
+        self._write_cache()
 
 
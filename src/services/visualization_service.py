@@ -3,20 +3,48 @@ Service for handling path visualization.
 Single responsibility: Map visualization and plot generation.
 """
 
-import matplotlib.pyplot as plt
-from matplotlib.lines import Line2D
+import numpy as np
 from typing import List, Set, Optional
 
+# matplotlib is imported inside the plotting methods: pulling in pyplot
+# costs tens of MB and noticeable startup time, which path-only runs
+# should never pay.
+
 from config.settings import VISUALIZATION_COLORS, DEFAULT_FIGSIZE, DEFAULT_DPI
 
 
 class VisualizationService:
     """Service for creating path visualizations."""
-    
+
     def __init__(self, graph_model, location_model):
         """Initialize with required models."""
         self.graph_model = graph_model
         self.location_model = location_model
+
+        # Structure-of-arrays coordinate cache: per-edge drawing used to
+        # chase graph.nodes[u]['x'] dict lookups; with an id -> index map
+        # and two parallel columns a whole path resolves to coordinates
+        # with one fancy-indexed gather.
+        graph = graph_model.graph
+        self._node_idx = {node: i for i, node in enumerate(graph.nodes)}
+        self._xs = np.fromiter(
+            (data['x'] for _, data in graph.nodes(data=True)),
+            dtype=np.float64,
+            count=len(self._node_idx),
+        )
+        self._ys = np.fromiter(
+            (data['y'] for _, data in graph.nodes(data=True)),
+            dtype=np.float64,
+            count=len(self._node_idx),
+        )
+
+    def _path_coords(self, path: List[int]) -> tuple:
+        """Resolve a node-id path to (xs, ys) coordinate arrays."""
+        idx = np.fromiter(
+            (self._node_idx[n] for n in path if n in self._node_idx),
+            dtype=np.intp,
+        )
+        return self._xs[idx], self._ys[idx]
     
     def create_path_visualization(
         self,
@@ -37,6 +65,8 @@ class VisualizationService:
             show_plot: Whether to display the plot
         """
         try:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=DEFAULT_FIGSIZE)
             
             # Plot base graph
@@ -66,36 +96,65 @@ class VisualizationService:
             self._fallback_text_output(primary_path, alternative_paths)
     
     def _plot_base_graph(self, ax) -> None:
-        """Plot the base road network graph."""
-        import osmnx as ox
-        
-        ox.plot_graph(
-            self.graph_model.graph,
-            show=False,
-            close=False,
-            node_size=0,  # Hide all nodes
-            edge_linewidth=0.3,
-            edge_color=VISUALIZATION_COLORS["base_edges"],
-            ax=ax
-        )
+        """Plot the base road network as a single LineCollection."""
+        from matplotlib.collections import LineCollection
+
+        # ox.plot_graph builds a GeoDataFrame and one artist per edge
+        # geometry; for a static backdrop the edge endpoints gathered
+        # from the coordinate columns are enough and draw in one call.
+        idx = self._node_idx
+        pairs = [
+            (idx[u], idx[v])
+            for u, v in self.graph_model.graph.edges()
+            if u in idx and v in idx
+        ]
+        if pairs:
+            arr = np.asarray(pairs, dtype=np.intp)
+            segs = np.empty((len(pairs), 2, 2), dtype=np.float64)
+            segs[:, 0, 0] = self._xs[arr[:, 0]]
+            segs[:, 0, 1] = self._ys[arr[:, 0]]
+            segs[:, 1, 0] = self._xs[arr[:, 1]]
+            segs[:, 1, 1] = self._ys[arr[:, 1]]
+            ax.add_collection(LineCollection(
+                segs, colors=VISUALIZATION_COLORS["base_edges"], linewidths=0.3
+            ))
+        # add_collection does not autoscale; frame the whole network.
+        pad_x = (self._xs.max() - self._xs.min()) * 0.02
+        pad_y = (self._ys.max() - self._ys.min()) * 0.02
+        ax.set_xlim(self._xs.min() - pad_x, self._xs.max() + pad_x)
+        ax.set_ylim(self._ys.min() - pad_y, self._ys.max() + pad_y)
+        ax.set_facecolor("white")
     
     def _plot_explored_area(self, ax, visited_nodes: Set[int]) -> None:
         """Plot the explored area in light blue."""
         from config.settings import EXPLORED_LINE_WIDTH, EXPLORED_ALPHA
-        
+        from matplotlib.collections import LineCollection
+
         visited_nodes_list = list(visited_nodes)
         if visited_nodes_list:
             visited_subgraph = self.graph_model.get_subgraph(visited_nodes_list)
-            
-            for u, v, data in visited_subgraph.edges(data=True):
-                if self.graph_model.node_exists(u) and self.graph_model.node_exists(v):
-                    x_coords = [self.graph_model.get_node_data(u)['x'], 
-                               self.graph_model.get_node_data(v)['x']]
-                    y_coords = [self.graph_model.get_node_data(u)['y'], 
-                               self.graph_model.get_node_data(v)['y']]
-                    ax.plot(x_coords, y_coords, 'b-', 
-                           linewidth=EXPLORED_LINE_WIDTH, 
-                           alpha=EXPLORED_ALPHA)
+
+            # One LineCollection for the whole explored area: a search can
+            # touch thousands of edges, and per-edge ax.plot would create
+            # that many Line2D artists.
+            idx = self._node_idx
+            pairs = [
+                (idx[u], idx[v])
+                for u, v in visited_subgraph.edges()
+                if u in idx and v in idx
+            ]
+            if not pairs:
+                return
+            arr = np.asarray(pairs, dtype=np.intp)
+            segs = np.empty((len(pairs), 2, 2), dtype=np.float64)
+            segs[:, 0, 0] = self._xs[arr[:, 0]]
+            segs[:, 0, 1] = self._ys[arr[:, 0]]
+            segs[:, 1, 0] = self._xs[arr[:, 1]]
+            segs[:, 1, 1] = self._ys[arr[:, 1]]
+            lc = LineCollection(
+                segs, colors='b', linewidths=EXPLORED_LINE_WIDTH, alpha=EXPLORED_ALPHA
+            )
+            ax.add_collection(lc)
     
     def _plot_alternative_paths(self, ax, alternative_paths: List[List[int]]) -> List[str]:
         """Plot all alternative paths with distinct colors."""
@@ -121,19 +180,18 @@ class VisualizationService:
     
     def _draw_path(self, ax, path: List[int], color: str, linewidth: float) -> None:
         """Draw a single path on the map."""
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i+1]
-            if self.graph_model.node_exists(u) and self.graph_model.node_exists(v):
-                x_coords = [self.graph_model.get_node_data(u)['x'], 
-                           self.graph_model.get_node_data(v)['x']]
-                y_coords = [self.graph_model.get_node_data(u)['y'], 
-                           self.graph_model.get_node_data(v)['y']]
-                ax.plot(x_coords, y_coords, color=color, linewidth=linewidth, alpha=0.9)
+        xs, ys = self._path_coords(path)
+        if len(xs) > 1:
+            # One plot call for the whole polyline instead of one per edge.
+            ax.plot(xs, ys, color=color, linewidth=linewidth, alpha=0.9)
     
     def _add_title_and_legend(self, ax, primary_path: List[int], 
                              alternative_paths: List[List[int]], 
                              legend_entries: List[str]) -> None:
         """Add title and legend to the plot."""
+        import matplotlib.pyplot as plt
+        from matplotlib.lines import Line2D
+
         # Add title
         start_name = self.location_model.get_node_name(primary_path[0]) if primary_path else "Start"
         end_name = self.location_model.get_node_name(primary_path[-1]) if primary_path else "End"
@@ -159,6 +217,8 @@ class VisualizationService:
     
     def _finalize_plot(self, fig, save_path: str, show_plot: bool) -> None:
         """Save and/or display the plot."""
+        import matplotlib.pyplot as plt
+
         if save_path:
             plt.savefig(save_path, dpi=DEFAULT_DPI, bbox_inches='tight', facecolor='white')
             print(f"Visualization saved as '{save_path}'")
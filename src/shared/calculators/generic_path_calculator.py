@@ -5,36 +5,102 @@ Completely domain-agnostic and reusable for any graph type.
 
 from typing import List, Dict, Any
 
+import numpy as np
+
 from core.graph_interface import GraphInterface, PathCalculatorInterface
 
+if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+
+    def _popcount(bits: np.ndarray) -> int:
+        """Total number of set bits in a uint64 bitset."""
+        return int(np.bitwise_count(bits).sum())
+
+else:  # requirements floor is numpy>=1.26, which lacks bitwise_count
+
+    def _popcount(bits: np.ndarray) -> int:
+        """Total number of set bits in a uint64 bitset."""
+        return int(np.unpackbits(bits.view(np.uint8)).sum())
+
 
 class GenericPathCalculator(PathCalculatorInterface):
     """Generic path calculator implementation."""
-    
+
+    def __init__(self, csr_graph=None):
+        """Initialize, optionally with a CSR adjacency for fast lookups."""
+        self.csr_graph = csr_graph
+        # Path -> (node bitset, popcount) memo for similarity checks;
+        # the alternative-path search compares many candidates against
+        # the same primary, so the primary's bitset is built once.
+        self._bits_cache: dict = {}
+        # Path -> cost memo: one search run prices the same path in the
+        # distance constraint, the time constraint and the statistics
+        # pass, so the edge walk should happen once per path.
+        self._cost_cache: dict = {}
+
+    def set_csr(self, csr_graph) -> None:
+        """Install a CSR adjacency so path costs become one array gather."""
+        self.csr_graph = csr_graph
+        self._bits_cache.clear()
+        self._cost_cache.clear()
+
+    def _node_bits(self, path_key: tuple):
+        """Uint64 bitset over CSR indices for a path, with its popcount."""
+        cached = self._bits_cache.get(path_key)
+        if cached is None:
+            csr = self.csr_graph
+            idx = np.fromiter(
+                (csr.node_to_idx[node] for node in path_key),
+                dtype=np.int64, count=len(path_key),
+            )
+            bits = np.zeros((csr.num_nodes + 63) >> 6, dtype=np.uint64)
+            np.bitwise_or.at(
+                bits, idx >> 6, np.uint64(1) << (idx & 63).astype(np.uint64)
+            )
+            cached = (bits, _popcount(bits))
+            if len(self._bits_cache) > 64:
+                self._bits_cache.clear()
+            self._bits_cache[path_key] = cached
+        return cached
+
     def calculate_path_cost(self, path: List[int], graph: GraphInterface) -> float:
         """
         Calculate total cost of a path.
-        
+
         Args:
             path: List of node IDs
             graph: Graph implementation
-            
+
         Returns:
             Total cost of the path
         """
-        total_cost = 0.0
-        
-        for i in range(len(path) - 1):
+        path_key = tuple(path)
+        cached = self._cost_cache.get(path_key)
+        if cached is not None:
+            return cached
+
+        total_cost = None
+        if self.csr_graph is not None:
             try:
-                edge_data = graph.get_edge_data(path[i], path[i+1])
-                if edge_data and 'length' in edge_data:
-                    total_cost += edge_data['length']
-                else:
-                    # Fallback: use unit cost
-                    total_cost += 1.0
-            except:
-                continue
-                
+                total_cost = self.csr_graph.path_distance(path)
+            except KeyError:
+                pass  # node outside the CSR snapshot: use the graph
+
+        if total_cost is None:
+            total_cost = 0.0
+            for i in range(len(path) - 1):
+                try:
+                    edge_data = graph.get_edge_data(path[i], path[i+1])
+                    if edge_data and 'length' in edge_data:
+                        total_cost += edge_data['length']
+                    else:
+                        # Fallback: use unit cost
+                        total_cost += 1.0
+                except:
+                    continue
+
+        if len(self._cost_cache) > 64:
+            self._cost_cache.clear()
+        self._cost_cache[path_key] = total_cost
         return total_cost
     
     def paths_are_similar(self, path1: List[int], path2: List[int], threshold: float = 0.8) -> bool:
@@ -51,7 +117,19 @@ class GenericPathCalculator(PathCalculatorInterface):
         """
         if not path2:
             return False
-            
+
+        if self.csr_graph is not None:
+            try:
+                bits1, count1 = self._node_bits(tuple(path1))
+                bits2, count2 = self._node_bits(tuple(path2))
+            except KeyError:
+                pass  # node outside the CSR snapshot: use set ops
+            else:
+                # Intersection via AND + popcount instead of hashing
+                # every node of every candidate into a fresh set.
+                common = _popcount(bits1 & bits2)
+                return common / max(count1, count2) > threshold
+
         # Calculate similarity based on common nodes
         common_nodes = set(path1) & set(path2)
         similarity = len(common_nodes) / max(len(set(path1)), len(set(path2)))
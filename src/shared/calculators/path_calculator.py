@@ -5,42 +5,73 @@ Single responsibility: Mathematical calculations for paths.
 
 from typing import List, Dict, Any
 
+import numpy as np
+
+EARTH_RADIUS_M = 6_371_000.0
+
+
+def _haversine_meters(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorized great-circle distance between coordinate arrays."""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2.0) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
 
 class PathCalculator:
     """Utility class for path-related calculations."""
-    
+
     @staticmethod
     def calculate_path_distance(graph, path: List[int]) -> float:
         """
         Calculate total distance of a path in meters.
-        
+
         Args:
             graph: NetworkX graph object
             path: List of node IDs representing the path
-            
+
         Returns:
             Total distance in meters
         """
         total_distance = 0.0
-        
+        fallback_pairs = []
+
         for i in range(len(path) - 1):
             try:
-                # Get edge length if available
+                # Get edge length if available (either direction, since
+                # paths may traverse directed edges backwards)
                 edge_data = graph.get_edge_data(path[i], path[i+1])
+                if edge_data is None:
+                    edge_data = graph.get_edge_data(path[i+1], path[i])
                 if edge_data and 'length' in edge_data[0]:
                     total_distance += edge_data[0]['length']
                 else:
-                    # Fallback: calculate Euclidean distance
-                    node1_data = graph.nodes[path[i]]
-                    node2_data = graph.nodes[path[i+1]]
-                    lat1, lon1 = node1_data['y'], node1_data['x']
-                    lat2, lon2 = node2_data['y'], node2_data['x']
-                    # Simple approximation (not perfect but works for visualization)
-                    distance = ((lat2 - lat1) ** 2 + (lon2 - lon1) ** 2) ** 0.5 * 111000
-                    total_distance += distance
+                    fallback_pairs.append((path[i], path[i+1]))
             except:
                 continue
-                
+
+        if fallback_pairs:
+            # One vectorized haversine over every edge that lacks a
+            # length attribute, instead of interpreted per-edge math;
+            # also replaces the flat 111 km/degree approximation.
+            nodes = graph.nodes
+            coords = np.array(
+                [
+                    (nodes[u]['y'], nodes[u]['x'], nodes[v]['y'], nodes[v]['x'])
+                    for u, v in fallback_pairs
+                    if u in nodes and v in nodes
+                ],
+                dtype=np.float64,
+            )
+            if len(coords):
+                total_distance += float(
+                    _haversine_meters(
+                        coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3]
+                    ).sum()
+                )
+
         return total_distance
     
     @staticmethod